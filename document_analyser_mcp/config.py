@@ -1,8 +1,17 @@
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load .env once per process; variables already exported by the parent win"""
+    from dotenv import load_dotenv
+    load_dotenv(override=False)
 
 # Load environment variables
-load_dotenv()
+_load_env()
+
+# Keep HF tokenizers single-threaded; avoids the fork warning and oversubscription
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 
 class Config:
     # Hugging Face API Configuration
@@ -12,6 +21,11 @@ class Config:
     
     # File paths
     DOCUMENTS_FILE = "data/documents.json"
+    DOCUMENTS_DB_FILE = "data/documents.sqlite"
+    
+    # Document storage backend: "json" or "sqlite" (WAL + FTS5 search index)
+    DOCUMENT_STORAGE = os.getenv("DOCUMENT_STORAGE", "json")
+    CACHE_FILE = "data/cache.sqlite"
     
     # API Configuration
     API_TIMEOUT = 30
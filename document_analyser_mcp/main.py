@@ -5,7 +5,7 @@ Document Analyzer MCP Server
 A FastMCP server that provides document analysis capabilities including:
 - Sentiment analysis using Hugging Face API
 - Keyword extraction using KeyBERT
-- Readability scoring using textstat
+- Readability scoring (Flesch, Flesch-Kincaid, Gunning Fog)
 - Text statistics using spaCy
 - Document storage and search functionality
 
@@ -13,40 +13,94 @@ Author: AI Assistant
 Date: 2024-12-15
 """
 
+import asyncio
+import atexit
 import logging
+import queue
 import sys
 import os
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # Add the current directory to Python path for imports
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
+import orjson
 from fastmcp import FastMCP
 from tools.add_document import register_add_document_tool
-from tools.analyze_document import register_analyze_document_tool
+from tools.analyze_document import register_analyze_document_tool, warm_up_process_pool
 from tools.get_sentiment import register_get_sentiment_tool
 from tools.extract_keywords import register_extract_keywords_tool
 from tools.search_documents import register_search_documents_tool
+from services import sentiment_service
+from services.registry import get_keyword_service, get_sentiment_service
 from config import Config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('document_analyzer.log')
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
+def configure_logging():
+    """Send log records through a queue to stdout and the log file
+
+    Tool handlers only enqueue records; a background listener thread does
+    the actual writes. Called from main() so spawned pool workers, which
+    import this file as __mp_main__, do not start a listener of their own.
+    """
+    log_queue = queue.SimpleQueue()
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    stream_handler = logging.StreamHandler(sys.stdout)
+    file_handler = RotatingFileHandler(
+        'document_analyzer.log',
+        maxBytes=10_000_000,
+        backupCount=3,
+        delay=True
+    )
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+    
+    listener = QueueListener(log_queue, stream_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+
+def serialize_tool_result(data) -> str:
+    """Serialize tool return values with orjson instead of the stdlib encoder"""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+async def _warmup():
+    """Build the analysis services (and load their models) off the event loop"""
+    try:
+        await asyncio.to_thread(get_keyword_service)
+        # spaCy and the readability service load in the pool workers only
+        await warm_up_process_pool()
+        get_sentiment_service()
+        logger.info("Analysis services warmed up")
+    except Exception as e:
+        logger.error("Service warmup failed: %s", e)
+
+@asynccontextmanager
+async def lifespan(app: FastMCP):
+    """Warm up models in the background once the server is accepting requests"""
+    warmup_task = asyncio.create_task(_warmup())
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+        # Close the pooled Hugging Face connections, if the service was built
+        if sentiment_service._instance is not None:
+            await sentiment_service._instance.aclose()
+
 def create_app() -> FastMCP:
     """Create and configure the FastMCP application"""
     
     # Initialize FastMCP app
-    app = FastMCP("Document Analyzer MCP Server")
+    app = FastMCP(
+        "Document Analyzer MCP Server",
+        tool_serializer=serialize_tool_result,
+        lifespan=lifespan
+    )
     
     # Add description and metadata
     app.description = """
@@ -68,11 +122,12 @@ def create_app() -> FastMCP:
     🔧 Powered by:
     - Hugging Face API for sentiment analysis
     - KeyBERT for keyword extraction
-    - textstat for readability metrics
+    - Single-pass readability metrics with textstat syllable counts
     - spaCy for text processing
     """
     
-    # Register all MCP tools
+    # Register all MCP tools. Registration is cheap: the analysis services
+    # (KeyBERT, spaCy, Hugging Face client) are built on first call.
     logger.info("Registering MCP tools...")
     
     try:
@@ -94,13 +149,15 @@ def create_app() -> FastMCP:
         logger.info("All MCP tools registered successfully!")
         
     except Exception as e:
-        logger.error(f"Failed to register tools: {e}")
+        logger.error("Failed to register tools: %s", e)
         raise
     
     return app
 
 def main():
     """Main entry point for the application"""
+    configure_logging()
+    
     try:
         logger.info("Starting Document Analyzer MCP Server...")
         
@@ -118,11 +175,13 @@ def main():
         return app
         
     except Exception as e:
-        logger.error(f"Failed to start server: {e}")
+        logger.error("Failed to start server: %s", e)
         sys.exit(1)
 
-# Create the app instance
-app = main()
+# Create the app instance (spawned pool workers import this file as
+# __mp_main__ and must not build a second server or log listener)
+if __name__ != "__mp_main__":
+    app = main()
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,27 +1,37 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Any
 
 class SentimentResult(BaseModel):
     """Sentiment analysis result"""
+    model_config = ConfigDict(frozen=True)
+
     label: str = Field(..., description="Sentiment label: POSITIVE, NEGATIVE, or NEUTRAL")
     confidence: float = Field(..., description="Confidence score between 0 and 1")
+    fallback: bool = Field(default=False, exclude=True, description="True when default values stand in for a failed analysis")
 
 class ReadabilityResult(BaseModel):
     """Readability analysis result"""
+    model_config = ConfigDict(frozen=True)
+
     flesch_reading_ease: float = Field(..., description="Flesch Reading Ease score")
     flesch_kincaid_grade: float = Field(..., description="Flesch-Kincaid Grade Level")
     gunning_fog_index: float = Field(..., description="Gunning Fog Index")
+    fallback: bool = Field(default=False, exclude=True, description="True when default values stand in for a failed analysis")
 
 class StatsResult(BaseModel):
     """Text statistics result"""
+    model_config = ConfigDict(frozen=True)
+
     word_count: int = Field(..., description="Total number of words")
     sentence_count: int = Field(..., description="Total number of sentences")
     avg_words_per_sentence: float = Field(..., description="Average words per sentence")
     character_count: int = Field(..., description="Total character count")
+    fallback: bool = Field(default=False, exclude=True, description="True when default values stand in for a failed analysis")
 
 class KeywordResult(BaseModel):
     """Keyword extraction result"""
     keywords: List[str] = Field(..., description="List of extracted keywords")
+    fallback: bool = Field(default=False, exclude=True, description="True when default values stand in for a failed analysis")
 
 class AnalysisResult(BaseModel):
     """Complete document analysis result"""
@@ -34,4 +44,4 @@ class AnalysisResult(BaseModel):
 class TextAnalysisRequest(BaseModel):
     """Request model for text analysis"""
     text: str = Field(..., description="Text to analyze")
-    limit: int = Field(default=5, description="Maximum number of keywords to extract")
+    limit: int = Field(default=5, ge=1, le=20, description="Maximum number of keywords to extract")
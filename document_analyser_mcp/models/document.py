@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
@@ -21,6 +21,8 @@ class DocumentCreate(BaseModel):
 
 class DocumentSummary(BaseModel):
     """Simplified document model for search results"""
+    model_config = ConfigDict(frozen=True)
+
     document_id: str
     title: str
     author: str
@@ -1,6 +1,8 @@
 from typing import List, Optional, Dict, Any
 from models.document import Document, DocumentCreate, DocumentSummary
 from utils.file_utils import DocumentStorage
+from utils.sqlite_storage import SQLiteDocumentStorage
+from config import Config
 from utils.validation import validate_text_length, sanitize_text
 import logging
 
@@ -10,7 +12,11 @@ class DocumentService:
     """Service for document management operations"""
     
     def __init__(self, storage_path: str = "data/documents.json"):
-        self.storage = DocumentStorage(storage_path)
+        if Config.DOCUMENT_STORAGE == "sqlite":
+            # JSON file only seeds an empty database
+            self.storage = SQLiteDocumentStorage(Config.DOCUMENTS_DB_FILE, json_path=storage_path)
+        else:
+            self.storage = DocumentStorage(storage_path)
         logger.info("DocumentService initialized")
     
     def get_document(self, document_id: str) -> Optional[Document]:
@@ -18,7 +24,7 @@ class DocumentService:
         try:
             return self.storage.get_document(document_id)
         except Exception as e:
-            logger.error(f"Failed to get document {document_id}: {e}")
+            logger.error("Failed to get document %s: %s", document_id, e)
             return None
     
     def add_document(self, document_data: DocumentCreate) -> str:
@@ -42,12 +48,12 @@ class DocumentService:
             
             # Add document to storage
             document_id = self.storage.add_document(doc_dict)
-            logger.info(f"Document added successfully with ID: {document_id}")
+            logger.info("Document added successfully with ID: %s", document_id)
             
             return document_id
             
         except Exception as e:
-            logger.error(f"Failed to add document: {e}")
+            logger.error("Failed to add document: %s", e)
             raise
     
     def search_documents(self, query: str) -> List[DocumentSummary]:
@@ -58,10 +64,11 @@ class DocumentService:
             
             matching_docs = self.storage.search_documents(query)
             
-            # Convert to summary format
+            # Convert to summary format (fields come from already-validated
+            # Documents, so skip re-validation)
             summaries = []
             for doc in matching_docs:
-                summary = DocumentSummary(
+                summary = DocumentSummary.model_construct(
                     document_id=doc.document_id,
                     title=doc.title,
                     author=doc.author,
@@ -70,11 +77,11 @@ class DocumentService:
                 )
                 summaries.append(summary)
             
-            logger.info(f"Found {len(summaries)} documents matching query: {query}")
+            logger.info("Found %s documents matching query: %s", len(summaries), query)
             return summaries
             
         except Exception as e:
-            logger.error(f"Search failed for query '{query}': {e}")
+            logger.error("Search failed for query '%s': %s", query, e)
             return []
     
     def get_all_documents(self) -> List[DocumentSummary]:
@@ -84,7 +91,7 @@ class DocumentService:
             summaries = []
             
             for doc in all_docs:
-                summary = DocumentSummary(
+                summary = DocumentSummary.model_construct(
                     document_id=doc.document_id,
                     title=doc.title,
                     author=doc.author,
@@ -95,5 +102,14 @@ class DocumentService:
             return summaries
             
         except Exception as e:
-            logger.error(f"Failed to get all documents: {e}")
+            logger.error("Failed to get all documents: %s", e)
             return []
+
+_instance = None
+
+def get_document_service() -> DocumentService:
+    """Return the shared DocumentService, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = DocumentService()
+    return _instance
@@ -1,35 +1,82 @@
-from keybert import KeyBERT
+from collections import Counter
+from functools import lru_cache
 from typing import List
+from models.analysis import KeywordResult
+from utils.result_cache import get_result_cache
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Fallback extraction: words with 3+ letters
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Common stop words to filter out
+_STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
+    'those', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'must', 'can', 'shall', 'not', 'no', 'yes', 'all',
+    'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such'
+})
+
+@lru_cache(maxsize=1)
+def get_kw_model():
+    """Load the KeyBERT model on first use (keeps keybert out of the startup import graph)"""
+    from keybert import KeyBERT
+    return KeyBERT()
+
+# Candidate settings shared by embedding and extraction calls
+_NGRAM_RANGE = (1, 2)  # Extract 1-2 word phrases
+_STOP_WORDS_LANG = 'english'
+
 class KeywordService:
     """Service for keyword extraction using KeyBERT"""
     
     def __init__(self):
+        # Document/candidate embeddings per text, reused across different limits
+        self._embeddings = lru_cache(maxsize=256)(self._compute_embeddings)
+
         try:
             # Initialize KeyBERT with sentence-transformers model
-            self.kw_model = KeyBERT()
+            self.kw_model = get_kw_model()
             logger.info("KeyBERT model initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize KeyBERT: {e}")
+            logger.error("Failed to initialize KeyBERT: %s", e)
             self.kw_model = None
     
     def extract_keywords(self, text: str, limit: int = 5) -> List[str]:
         """Extract keywords from the given text"""
+        return self.extract(text, limit).keywords
+    
+    def extract(self, text: str, limit: int = 5) -> KeywordResult:
+        """Extract keywords, flagging results that came from the frequency fallback"""
         try:
             if not self.kw_model:
                 # Fallback to simple word frequency if KeyBERT fails
                 return self._fallback_keyword_extraction(text, limit)
             
-            # Use KeyBERT to extract keywords
+            # Reuse keywords already extracted for identical text
+            cache = get_result_cache()
+            cache_kind = f"keywords:{limit}"
+            cached = cache.get(cache_kind, "keybert", text)
+            if cached is not None:
+                return KeywordResult.model_construct(keywords=cached)
+            
+            # Use KeyBERT to extract keywords from precomputed embeddings
+            doc_embeddings, word_embeddings = self._embeddings(text)
             keywords = self.kw_model.extract_keywords(
                 text,
-                keyphrase_ngram_range=(1, 2),  # Extract 1-2 word phrases
-                stop_words='english',
+                keyphrase_ngram_range=_NGRAM_RANGE,
+                stop_words=_STOP_WORDS_LANG,
+                doc_embeddings=doc_embeddings,
+                word_embeddings=word_embeddings,
                 use_maxsum=True,  # Use Max Sum Similarity for diversity
-                nr_candidates=20  # Consider top 20 candidates
+                top_n=limit,
+                # Grow the Max Sum candidate pool only as the limit requires
+                nr_candidates=max(20, min(50, limit * 4))
             )
 
             # Limit the results
@@ -38,44 +85,41 @@ class KeywordService:
             # Extract just the keyword strings (not scores)
             keyword_list = [kw[0] for kw in keywords]
             
-            return keyword_list
+            cache.set(cache_kind, "keybert", text, keyword_list)
+            return KeywordResult.model_construct(keywords=keyword_list)
             
         except Exception as e:
-            logger.error(f"Keyword extraction failed: {e}")
+            logger.error("Keyword extraction failed: %s", e)
             return self._fallback_keyword_extraction(text, limit)
     
-    def _fallback_keyword_extraction(self, text: str, limit: int) -> List[str]:
+    def _compute_embeddings(self, text: str):
+        """Embed the document and its candidate phrases once per text"""
+        return self.kw_model.extract_embeddings(
+            text,
+            keyphrase_ngram_range=_NGRAM_RANGE,
+            stop_words=_STOP_WORDS_LANG
+        )
+    
+    def _fallback_keyword_extraction(self, text: str, limit: int) -> KeywordResult:
         """Simple fallback keyword extraction using word frequency"""
         try:
-            import re
-            from collections import Counter
-            
-            # Simple preprocessing
-            text = text.lower()
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text)  # Words with 3+ letters
-            
-            # Common stop words to filter out
-            stop_words = {
-                'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-                'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
-                'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
-                'those', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have',
-                'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-                'may', 'might', 'must', 'can', 'shall', 'not', 'no', 'yes', 'all',
-                'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such'
-            }
-            
-            # Filter out stop words
-            filtered_words = [word for word in words if word not in stop_words]
-            
-            # Count word frequency
-            word_counts = Counter(filtered_words)
+            # Words with 3+ letters, minus stop words
+            words = _WORD_RE.findall(text.lower())
+            word_counts = Counter(word for word in words if word not in _STOP_WORDS)
             
             # Get top keywords
-            top_keywords = [word for word, count in word_counts.most_common(limit)]
-            
-            return top_keywords
+            keywords = [word for word, count in word_counts.most_common(limit)]
             
         except Exception as e:
-            logger.error(f"Fallback keyword extraction failed: {e}")
-            return ["analysis", "text", "content"]  # Default keywords
+            logger.error("Fallback keyword extraction failed: %s", e)
+            keywords = ["analysis", "text", "content"]  # Default keywords
+        return KeywordResult.model_construct(keywords=keywords, fallback=True)
+
+_instance = None
+
+def get_keyword_service() -> KeywordService:
+    """Return the shared KeywordService, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = KeywordService()
+    return _instance
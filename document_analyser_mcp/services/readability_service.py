@@ -1,47 +1,89 @@
-import textstat
+from collections import Counter
+from functools import lru_cache
+from typing import Tuple
 from models.analysis import ReadabilityResult
+from utils.text_features import featurize
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def get_textstat():
+    """Import textstat (and its pyphen dictionary) on first use"""
+    import textstat
+    # English hyphenation rules for syllable counting
+    textstat.set_lang("en")
+    return textstat
+
+@lru_cache(maxsize=8192)
+def _syllables(word: str) -> int:
+    """Syllables in one word, counted the way textstat counts them for its scores"""
+    return get_textstat().syllable_count(word)
+
+def _compute_readability(text: str) -> Tuple[float, float, float]:
+    """Compute Flesch Reading Ease, Flesch-Kincaid Grade and Gunning Fog in one pass
+
+    Words, sentences, syllables and complex words (3+ syllables) are counted
+    from a single tokenization and shared by all three formulas.
+    """
+    features = featurize(text)
+    words = features.words_lower
+    word_count = len(words)
+    if word_count == 0:
+        raise ValueError("Text contains no words")
+    
+    sentence_count = features.sentence_count
+    
+    # Syllables are counted once per distinct word and weighted by frequency
+    syllable_count = 0
+    complex_words = 0
+    for word, occurrences in Counter(words).items():
+        syllables = _syllables(word)
+        syllable_count += syllables * occurrences
+        if syllables >= 3:
+            complex_words += occurrences
+    
+    words_per_sentence = word_count / sentence_count
+    syllables_per_word = syllable_count / word_count
+    
+    # Scale: 0-100 (higher = easier to read)
+    # 90-100: Very Easy, 80-90: Easy, 70-80: Fairly Easy
+    # 60-70: Standard, 50-60: Fairly Difficult, 30-50: Difficult, 0-30: Very Difficult
+    flesch_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    
+    # Indicates the US grade level needed to understand the text
+    flesch_kincaid = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    
+    # Estimates years of formal education needed to understand text
+    gunning_fog = 0.4 * (words_per_sentence + 100 * complex_words / word_count)
+    
+    return flesch_ease, flesch_kincaid, gunning_fog
+
 class ReadabilityService:
-    """Service for calculating readability metrics using textstat"""
+    """Service for calculating readability metrics"""
     
     def __init__(self):
-        # Set textstat language to English
-        textstat.set_lang("en")
         logger.info("ReadabilityService initialized")
     
     def calculate_readability(self, text: str) -> ReadabilityResult:
         """Calculate various readability metrics for the given text"""
         try:
-            # Calculate Flesch Reading Ease
-            # Scale: 0-100 (higher = easier to read)
-            # 90-100: Very Easy, 80-90: Easy, 70-80: Fairly Easy
-            # 60-70: Standard, 50-60: Fairly Difficult, 30-50: Difficult, 0-30: Very Difficult
-            flesch_ease = textstat.flesch_reading_ease(text)
-            
-            # Calculate Flesch-Kincaid Grade Level
-            # Indicates the US grade level needed to understand the text
-            flesch_kincaid = textstat.flesch_kincaid_grade(text)
+            flesch_ease, flesch_kincaid, gunning_fog = _compute_readability(text)
             
-            # Calculate Gunning Fog Index
-            # Estimates years of formal education needed to understand text
-            gunning_fog = textstat.gunning_fog(text)
-            
-            return ReadabilityResult(
+            return ReadabilityResult.model_construct(
                 flesch_reading_ease=round(flesch_ease, 2),
                 flesch_kincaid_grade=round(flesch_kincaid, 2),
                 gunning_fog_index=round(gunning_fog, 2)
             )
             
         except Exception as e:
-            logger.error(f"Readability calculation failed: {e}")
+            logger.error("Readability calculation failed: %s", e)
             # Return default values if calculation fails
-            return ReadabilityResult(
+            return ReadabilityResult.model_construct(
                 flesch_reading_ease=50.0,  # Standard difficulty
                 flesch_kincaid_grade=10.0,  # 10th grade level
-                gunning_fog_index=12.0     # 12 years education
+                gunning_fog_index=12.0,    # 12 years education
+                fallback=True
             )
     
     def get_readability_interpretation(self, flesch_score: float) -> str:
@@ -60,3 +102,12 @@ class ReadabilityService:
             return "Difficult (college level)"
         else:
             return "Very Difficult (graduate level)"
+
+_instance = None
+
+def get_readability_service() -> ReadabilityService:
+    """Return the shared ReadabilityService, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = ReadabilityService()
+    return _instance
@@ -0,0 +1,20 @@
+"""Single access point for the shared service instances
+
+Each getter builds its service (and loads any model) on first call and
+returns the same instance afterwards, so every tool and the startup warmup
+share one KeyBERT model, one spaCy pipeline and one HTTP client per process.
+"""
+
+from services.document_service import get_document_service
+from services.keyword_service import get_keyword_service
+from services.readability_service import get_readability_service
+from services.sentiment_service import get_sentiment_service
+from services.stats_service import get_stats_service
+
+__all__ = [
+    "get_document_service",
+    "get_keyword_service",
+    "get_readability_service",
+    "get_sentiment_service",
+    "get_stats_service",
+]
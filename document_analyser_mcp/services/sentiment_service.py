@@ -1,67 +1,171 @@
-import requests
 import asyncio
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from models.analysis import SentimentResult
 from config import Config
+from utils.result_cache import get_result_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Hugging Face requests (rate-limit friendly)
+_MAX_API_CONNECTIONS = 8
+
+class _SentimentBatcher:
+    """Coalesces concurrent sentiment requests into a single API call
+
+    Texts submitted within ``max_wait_ms`` of each other (up to ``max_batch``)
+    are sent together as one ``{"inputs": [...]}`` payload; the Hugging Face
+    Inference API answers list inputs with one prediction list per text.
+    """
+
+    def __init__(self, send_batch, max_batch: int = 16, max_wait_ms: int = 10):
+        self._send_batch = send_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, text: str) -> Any:
+        """Queue a text and wait for its predictions"""
+        loop = asyncio.get_running_loop()
+        self._ensure_worker(loop)
+        future = loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop):
+        """Start the drain task for the running loop if needed"""
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self):
+        """Drain the queue in batches and dispatch results to waiting callers"""
+        loop = asyncio.get_running_loop()
+        while True:
+            items: List[Tuple[str, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(items) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await self._send_batch([text for text, _ in items])
+                if not isinstance(results, list) or len(results) != len(items):
+                    raise ValueError("Unexpected batch response from sentiment API")
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), predictions in zip(items, results):
+                if not future.done():
+                    future.set_result(predictions)
+
 class SentimentService:
     """Service for sentiment analysis using Hugging Face API"""
     
     def __init__(self):
         self.api_key = Config.HUGGING_FACE_API_KEY
         self.api_url = Config.get_sentiment_api_url()
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        
+        # Imported here so httpx stays out of the server's startup import graph
+        import httpx
+        
+        # One pooled HTTP/2 client reuses TLS connections across calls and
+        # holds the auth headers, so they are built once per service
+        self._client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            },
+            http2=True,
+            timeout=Config.API_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=_MAX_API_CONNECTIONS,
+                max_keepalive_connections=_MAX_API_CONNECTIONS
+            )
+        )
+        self._batcher = _SentimentBatcher(self._analyze_batch)
+        
+        # Requests still waiting on the API, keyed by text
+        self._inflight: Dict[str, asyncio.Future] = {}
     
     async def analyze_sentiment(self, text: str) -> SentimentResult:
         """Analyze sentiment of the given text"""
         try:
-            # Prepare the request
-            payload = {"inputs": text}
+            # Reuse the prediction for identical text (the SQLite lookup runs
+            # off the event loop)
+            cache = get_result_cache()
+            cached = await asyncio.to_thread(cache.get, "sentiment", Config.HUGGING_FACE_MODEL, text)
+            if cached is not None:
+                return SentimentResult.model_construct(**cached)
             
-            # Make async request to Hugging Face API
-            response = await self._make_request(payload)
+            # Concurrent calls are batched into a single Hugging Face request;
+            # identical texts already in flight share the pending prediction
+            predictions = await asyncio.shield(self._predict(text))
             
             # Parse response
-            if response and len(response) > 0:
+            if predictions:
                 # Get the highest confidence prediction
-                predictions = response[0]
                 best_prediction = max(predictions, key=lambda x: x['score'])
                 
                 # Map label to standard format
                 label = self._normalize_label(best_prediction['label'])
                 confidence = best_prediction['score']
                 
-                return SentimentResult(label=label, confidence=confidence)
+                result = SentimentResult.model_construct(label=label, confidence=confidence)
+                await asyncio.to_thread(cache.set, "sentiment", Config.HUGGING_FACE_MODEL, text, result.model_dump())
+                return result
             else:
                 # Fallback to neutral if API fails
-                return SentimentResult(label="NEUTRAL", confidence=0.5)
+                return SentimentResult.model_construct(label="NEUTRAL", confidence=0.5, fallback=True)
                 
         except Exception as e:
-            logger.error(f"Sentiment analysis failed: {e}")
+            logger.error("Sentiment analysis failed: %s", e)
             # Return neutral sentiment as fallback
-            return SentimentResult(label="NEUTRAL", confidence=0.5)
+            return SentimentResult.model_construct(label="NEUTRAL", confidence=0.5, fallback=True)
+    
+    def _predict(self, text: str) -> asyncio.Future:
+        """Return the pending prediction for this text, submitting it if needed"""
+        future = self._inflight.get(text)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            future = asyncio.ensure_future(self._batcher.submit(text))
+            self._inflight[text] = future
+            
+            def _forget(done: asyncio.Future):
+                if self._inflight.get(text) is done:
+                    del self._inflight[text]
+            future.add_done_callback(_forget)
+        return future
+    
+    async def _analyze_batch(self, texts: List[str]) -> List[Any]:
+        """Send a batch of texts and return one prediction list per text"""
+        response = await self._make_request({"inputs": texts})
+        
+        # A single input may come back unwrapped as a flat list of labels
+        if len(texts) == 1 and response and isinstance(response[0], dict):
+            return [response]
+        return response
     
     async def _make_request(self, payload: Dict[str, Any]) -> Any:
         """Make async HTTP request to Hugging Face API"""
-        loop = asyncio.get_event_loop()
-        
-        def make_sync_request():
-            response = requests.post(
-                self.api_url,
-                headers=self.headers,
-                json=payload,
-                timeout=Config.API_TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
-        
-        return await loop.run_in_executor(None, make_sync_request)
+        response = await self._client.post(self.api_url, json=payload)
+        response.raise_for_status()
+        return response.json()
+    
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        await self._client.aclose()
     
     def _normalize_label(self, label: str) -> str:
         """Normalize sentiment labels to standard format"""
@@ -74,3 +178,12 @@ class SentimentService:
             return "NEGATIVE"
         else:
             return "NEUTRAL"
+
+_instance = None
+
+def get_sentiment_service() -> SentimentService:
+    """Return the shared SentimentService, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = SentimentService()
+    return _instance
@@ -1,20 +1,42 @@
-import spacy
+from functools import lru_cache
 from models.analysis import StatsResult
+from utils.text_features import featurize
 import logging
-import re
 
 logger = logging.getLogger(__name__)
 
+# Only tokenization and sentence boundaries are needed for stats
+_UNUSED_PIPES = ["tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """Load a minimal spaCy English pipeline on first use"""
+    import spacy
+    try:
+        # Statistical sentence segmenter without the heavy components
+        nlp = spacy.load("en_core_web_sm", exclude=_UNUSED_PIPES)
+        nlp.enable_pipe("senter")
+    except OSError:
+        # Model not installed: rule-based sentencizer on a blank pipeline
+        logger.warning("spaCy en_core_web_sm model not found, using rule-based sentencizer")
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+    return nlp
+
+def _charcount_no_ws(text: str) -> int:
+    """Count characters excluding spaces, newlines and tabs without copying the text"""
+    return len(text) - text.count(' ') - text.count('\n') - text.count('\t')
+
 class StatsService:
     """Service for calculating text statistics using spaCy"""
     
     def __init__(self):
         try:
-            # Load English language model
-            self.nlp = spacy.load("en_core_web_sm")
+            # Load English tokenizer + sentence segmenter
+            self.nlp = get_nlp()
             logger.info("spaCy model loaded successfully")
-        except OSError:
-            logger.warning("spaCy en_core_web_sm model not found, using fallback methods")
+        except (ImportError, OSError, ValueError):
+            logger.warning("spaCy pipeline unavailable, using fallback methods")
             self.nlp = None
     
     def calculate_stats(self, text: str) -> StatsResult:
@@ -26,7 +48,7 @@ class StatsService:
                 return self._calculate_fallback(text)
                 
         except Exception as e:
-            logger.error(f"Stats calculation failed: {e}")
+            logger.error("Stats calculation failed: %s", e)
             return self._calculate_fallback(text)
     
     def _calculate_with_spacy(self, text: str) -> StatsResult:
@@ -44,9 +66,9 @@ class StatsService:
         avg_words_per_sentence = word_count / sentence_count if sentence_count > 0 else 0
         
         # Character count (excluding whitespace)
-        character_count = len(text.replace(' ', '').replace('\n', '').replace('\t', ''))
+        character_count = _charcount_no_ws(text)
         
-        return StatsResult(
+        return StatsResult.model_construct(
             word_count=word_count,
             sentence_count=sentence_count,
             avg_words_per_sentence=round(avg_words_per_sentence, 2),
@@ -55,23 +77,30 @@ class StatsService:
     
     def _calculate_fallback(self, text: str) -> StatsResult:
         """Fallback stats calculation without spaCy"""
-        # Simple word counting (split by whitespace, filter empty strings)
-        words = [word for word in text.split() if word.strip()]
-        word_count = len(words)
-        
-        # Simple sentence counting (count sentence-ending punctuation)
-        sentence_endings = re.findall(r'[.!?]+', text)
-        sentence_count = len(sentence_endings) if sentence_endings else 1
+        # Shared tokenization: whitespace words and sentence-ending punctuation
+        features = featurize(text)
+        word_count = features.whitespace_word_count
+        sentence_count = features.sentence_count
         
         # Calculate average words per sentence
         avg_words_per_sentence = word_count / sentence_count if sentence_count > 0 else 0
         
         # Character count (excluding whitespace)
-        character_count = len(text.replace(' ', '').replace('\n', '').replace('\t', ''))
+        character_count = _charcount_no_ws(text)
         
-        return StatsResult(
+        return StatsResult.model_construct(
             word_count=word_count,
             sentence_count=sentence_count,
             avg_words_per_sentence=round(avg_words_per_sentence, 2),
-            character_count=character_count
+            character_count=character_count,
+            fallback=True
         )
+
+_instance = None
+
+def get_stats_service() -> StatsService:
+    """Return the shared StatsService, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = StatsService()
+    return _instance
@@ -1,13 +1,11 @@
 from fastmcp import FastMCP
 from models.document import DocumentCreate
-from services.document_service import DocumentService
+from services.registry import get_document_service
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Initialize services
-document_service = DocumentService()
-
 def register_add_document_tool(app: FastMCP):
     """Register the add_document tool with the FastMCP app"""
     
@@ -42,8 +40,8 @@ def register_add_document_tool(app: FastMCP):
                 category=category
             )
             
-            # Add document using service
-            document_id = document_service.add_document(document_data)
+            # Add document using service (file write runs on a worker thread)
+            document_id = await asyncio.to_thread(get_document_service().add_document, document_data)
             
             return {
                 "success": True,
@@ -52,14 +50,14 @@ def register_add_document_tool(app: FastMCP):
             }
             
         except ValueError as e:
-            logger.error(f"Validation error in add_document: {e}")
+            logger.error("Validation error in add_document: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "message": "Failed to add document due to validation error"
             }
         except Exception as e:
-            logger.error(f"Error in add_document: {e}")
+            logger.error("Error in add_document: %s", e)
             return {
                 "success": False,
                 "error": "Internal server error",
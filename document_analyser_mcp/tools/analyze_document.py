@@ -1,21 +1,187 @@
 from fastmcp import FastMCP
-from services.document_service import DocumentService
-from services.sentiment_service import SentimentService
-from services.keyword_service import KeywordService
-from services.readability_service import ReadabilityService
-from services.stats_service import StatsService
+from services.registry import (
+    get_document_service,
+    get_sentiment_service,
+    get_keyword_service,
+    get_readability_service,
+    get_stats_service
+)
 from utils.validation import validate_keyword_limit
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
 import asyncio
+import hashlib
 import logging
+import multiprocessing
 
 logger = logging.getLogger(__name__)
 
-# Initialize services
-document_service = DocumentService()
-sentiment_service = SentimentService()
-keyword_service = KeywordService()
-readability_service = ReadabilityService()
-stats_service = StatsService()
+# Analysis metrics keyed on (SHA-256 of the text, keyword limit); the
+# response around them is built per call from the current document
+_ANALYSIS_CACHE_SIZE = 512
+_ANALYSIS_CACHE: "OrderedDict[Tuple[bytes, int], Dict]" = OrderedDict()
+
+_POOL_WORKERS = 2
+_POOL_TIMEOUT_SECONDS = 30
+
+# Workers are spawned, not forked: the server process runs threads (log
+# listener, asyncio.to_thread) whose locks a fork would copy mid-use
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+_pool: Optional[ProcessPoolExecutor] = None
+
+def _init_worker():
+    """Build the analysis services (and load spaCy) as soon as a worker starts"""
+    # Workers skip the server's queue logging; they write to stderr directly
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(processName)s - %(levelname)s - %(message)s'
+    )
+    get_readability_service()
+    get_stats_service()
+
+def _ping() -> bool:
+    return True
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Worker processes for the pure-Python analyses (created on first use)"""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=_POOL_WORKERS,
+            mp_context=_POOL_CONTEXT,
+            initializer=_init_worker
+        )
+    return _pool
+
+def _discard_process_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next call starts fresh workers"""
+    global _pool
+    if _pool is pool:
+        _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+async def _run_in_pool(fn, *args):
+    """Run fn in a pool worker, replacing the pool if a worker died"""
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    try:
+        return await asyncio.wait_for(loop.run_in_executor(pool, fn, *args), _POOL_TIMEOUT_SECONDS)
+    except BrokenProcessPool:
+        logger.warning("Analysis worker pool broke; starting a new one")
+        _discard_process_pool(pool)
+        raise
+
+async def warm_up_process_pool():
+    """Start the pool workers so the first analysis does not pay for them"""
+    await asyncio.gather(*(_run_in_pool(_ping) for _ in range(_POOL_WORKERS)))
+
+def _calculate_text_metrics(text: str):
+    """Readability scores and text statistics, computed in one pool worker
+    
+    Both analyses share the worker's featurize() cache, so the text is
+    tokenized once for the pair.
+    """
+    return (
+        get_readability_service().calculate_readability(text),
+        get_stats_service().calculate_stats(text)
+    )
+
+async def _safe_sentiment(text: str, failures: List[str]) -> Dict:
+    """Sentiment as a response dict, neutral on failure"""
+    try:
+        result = await get_sentiment_service().analyze_sentiment(text)
+        if result.fallback:
+            failures.append("sentiment")
+        return {"label": result.label, "confidence": result.confidence}
+    except Exception as e:
+        logger.error("Sentiment analysis failed: %s", e)
+        failures.append("sentiment")
+        return {"label": "NEUTRAL", "confidence": 0.5}
+
+async def _safe_keywords(text: str, limit: int, failures: List[str]) -> List[str]:
+    """Keywords, generic keywords on failure"""
+    try:
+        # Thread, not process: torch releases the GIL and KeyBERT loads once
+        result = await asyncio.to_thread(get_keyword_service().extract, text, limit)
+        if result.fallback:
+            failures.append("keywords")
+        return result.keywords
+    except Exception as e:
+        logger.error("Keyword extraction failed: %s", e)
+        failures.append("keywords")
+        return ["analysis", "text", "content"]
+
+async def _safe_text_metrics(text: str, failures: List[str]) -> Tuple[Dict, Dict]:
+    """Readability and stats dicts, default scores and whitespace stats on failure"""
+    try:
+        # Both are pure Python, so they run together in a worker process
+        readability, stats = await _run_in_pool(_calculate_text_metrics, text)
+        if readability.fallback or stats.fallback:
+            failures.append("text_metrics")
+        return (
+            {
+                "flesch_reading_ease": readability.flesch_reading_ease,
+                "flesch_kincaid_grade": readability.flesch_kincaid_grade,
+                "gunning_fog_index": readability.gunning_fog_index
+            },
+            {
+                "word_count": stats.word_count,
+                "sentence_count": stats.sentence_count,
+                "avg_words_per_sentence": stats.avg_words_per_sentence,
+                "character_count": stats.character_count
+            }
+        )
+    except Exception as e:
+        logger.error("Readability/stats calculation failed: %s", e)
+        failures.append("text_metrics")
+        word_count = len(text.split())
+        return (
+            {
+                "flesch_reading_ease": 50.0,
+                "flesch_kincaid_grade": 10.0,
+                "gunning_fog_index": 12.0
+            },
+            {
+                "word_count": word_count,
+                "sentence_count": 1,
+                "avg_words_per_sentence": word_count,
+                "character_count": len(text)
+            }
+        )
+
+async def _analysis_metrics(text: str, limit: int) -> Dict:
+    """Sentiment, keywords, readability and stats of text, cached when none fell back"""
+    # Reuse the metrics of identical text
+    cache_key = (hashlib.sha256(text.encode("utf-8")).digest(), limit)
+    metrics = _ANALYSIS_CACHE.get(cache_key)
+    if metrics is not None:
+        _ANALYSIS_CACHE.move_to_end(cache_key)
+    else:
+        # Perform all analyses in parallel for better performance.
+        # Sentiment is scheduled first so its HTTP wait overlaps the
+        # CPU-bound analyses. Each wrapper returns its response shape
+        # (or fallback) and records failures instead of raising.
+        failures: List[str] = []
+        sentiment_result, keywords, (readability_result, stats_result) = await asyncio.gather(
+            _safe_sentiment(text, failures),
+            _safe_keywords(text, limit, failures),
+            _safe_text_metrics(text, failures)
+        )
+        metrics = {
+            "sentiment": sentiment_result,
+            "keywords": keywords,
+            "readability": readability_result,
+            "stats": stats_result
+        }
+        
+        # Fallback values are not worth caching
+        if not failures:
+            _ANALYSIS_CACHE[cache_key] = metrics
+            if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+                _ANALYSIS_CACHE.popitem(last=False)
+    return metrics
 
 def register_analyze_document_tool(app: FastMCP):
     """Register the analyze_document tool with the FastMCP app"""
@@ -44,8 +210,8 @@ def register_analyze_document_tool(app: FastMCP):
             # Validate and normalize keyword limit
             normalized_limit = validate_keyword_limit(limit)
             
-            # Get document
-            document = document_service.get_document(document_id.strip())
+            # Get document (off the event loop: a cold cache re-reads the file)
+            document = await asyncio.to_thread(get_document_service().get_document, document_id.strip())
             if not document:
                 return {
                     "success": False,
@@ -53,88 +219,23 @@ def register_analyze_document_tool(app: FastMCP):
                     "message": f"No document found with ID: {document_id}"
                 }
             
-            # Perform all analyses in parallel for better performance
-            sentiment_task = sentiment_service.analyze_sentiment(document.text)
-            keywords_task = asyncio.create_task(
-                asyncio.to_thread(keyword_service.extract_keywords, document.text, normalized_limit)
-            )
-            readability_task = asyncio.create_task(
-                asyncio.to_thread(readability_service.calculate_readability, document.text)
-            )
-            stats_task = asyncio.create_task(
-                asyncio.to_thread(stats_service.calculate_stats, document.text)
-            )
-            
-            # Wait for all analyses to complete
-            sentiment_result, keywords, readability_result, stats_result = await asyncio.gather(
-                sentiment_task,
-                keywords_task,
-                readability_task,
-                stats_task,
-                return_exceptions=True
-            )
-            
-            # Handle any exceptions from parallel execution
-            if isinstance(sentiment_result, Exception):
-                logger.error(f"Sentiment analysis failed: {sentiment_result}")
-                sentiment_result = {"label": "NEUTRAL", "confidence": 0.5}
-            else:
-                sentiment_result = {
-                    "label": sentiment_result.label,
-                    "confidence": sentiment_result.confidence
-                }
-            
-            if isinstance(keywords, Exception):
-                logger.error(f"Keyword extraction failed: {keywords}")
-                keywords = ["analysis", "text", "content"]
-            
-            if isinstance(readability_result, Exception):
-                logger.error(f"Readability analysis failed: {readability_result}")
-                readability_result = {
-                    "flesch_reading_ease": 50.0,
-                    "flesch_kincaid_grade": 10.0,
-                    "gunning_fog_index": 12.0
-                }
-            else:
-                readability_result = {
-                    "flesch_reading_ease": readability_result.flesch_reading_ease,
-                    "flesch_kincaid_grade": readability_result.flesch_kincaid_grade,
-                    "gunning_fog_index": readability_result.gunning_fog_index
-                }
-            
-            if isinstance(stats_result, Exception):
-                logger.error(f"Stats calculation failed: {stats_result}")
-                stats_result = {
-                    "word_count": len(document.text.split()),
-                    "sentence_count": 1,
-                    "avg_words_per_sentence": len(document.text.split()),
-                    "character_count": len(document.text)
-                }
-            else:
-                stats_result = {
-                    "word_count": stats_result.word_count,
-                    "sentence_count": stats_result.sentence_count,
-                    "avg_words_per_sentence": stats_result.avg_words_per_sentence,
-                    "character_count": stats_result.character_count
-                }
+            metrics = await _analysis_metrics(document.text, normalized_limit)
             
             # Compile complete analysis result
-            analysis_result = {
+            return {
                 "success": True,
                 "document_id": document_id,
                 "document_title": document.title,
                 "document_author": document.author,
-                "sentiment": sentiment_result,
-                "keywords": keywords,
-                "readability": readability_result,
-                "stats": stats_result,
+                "sentiment": dict(metrics["sentiment"]),
+                "keywords": list(metrics["keywords"]),
+                "readability": dict(metrics["readability"]),
+                "stats": dict(metrics["stats"]),
                 "message": f"Complete analysis of document '{document.title}' completed successfully"
             }
             
-            return analysis_result
-            
         except Exception as e:
-            logger.error(f"Error in analyze_document: {e}")
+            logger.error("Error in analyze_document: %s", e)
             return {
                 "success": False,
                 "error": "Analysis failed",
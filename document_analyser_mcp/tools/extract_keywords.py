@@ -1,13 +1,10 @@
 from fastmcp import FastMCP
-from services.keyword_service import KeywordService
+from services.registry import get_keyword_service
 from utils.validation import validate_text_length, validate_keyword_limit, sanitize_text
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Initialize services
-keyword_service = KeywordService()
-
 def register_extract_keywords_tool(app: FastMCP):
     """Register the extract_keywords tool with the FastMCP app"""
     
@@ -24,19 +21,20 @@ def register_extract_keywords_tool(app: FastMCP):
             Dictionary with extracted keywords list
         """
         try:
-            # Validate and sanitize input
-            if not text or not text.strip():
+            # Validate and sanitize input. The O(1) length check runs first
+            # so oversized payloads are rejected before any full-text scan.
+            if text and not validate_text_length(text):
                 return {
                     "success": False,
-                    "error": "Empty text provided",
-                    "message": "Please provide text to extract keywords from"
+                    "error": "Text too long",
+                    "message": "Text exceeds maximum length limit"
                 }
             
-            if not validate_text_length(text):
+            if not text or not text.strip():
                 return {
                     "success": False,
-                    "error": "Text too long",
-                    "message": "Text exceeds maximum length limit"
+                    "error": "Empty text provided",
+                    "message": "Please provide text to extract keywords from"
                 }
             
             # Validate and normalize limit
@@ -46,7 +44,7 @@ def register_extract_keywords_tool(app: FastMCP):
             clean_text = sanitize_text(text)
             
             # Extract keywords
-            keywords = keyword_service.extract_keywords(clean_text, normalized_limit)
+            keywords = get_keyword_service().extract_keywords(clean_text, normalized_limit)
             
             return {
                 "success": True,
@@ -56,7 +54,7 @@ def register_extract_keywords_tool(app: FastMCP):
             }
             
         except Exception as e:
-            logger.error(f"Error in extract_keywords: {e}")
+            logger.error("Error in extract_keywords: %s", e)
             return {
                 "success": False,
                 "error": "Extraction failed",
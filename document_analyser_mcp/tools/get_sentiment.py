@@ -1,13 +1,10 @@
 from fastmcp import FastMCP
-from services.sentiment_service import SentimentService
+from services.registry import get_sentiment_service
 from utils.validation import validate_text_length, sanitize_text
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Initialize services
-sentiment_service = SentimentService()
-
 def register_get_sentiment_tool(app: FastMCP):
     """Register the get_sentiment tool with the FastMCP app"""
     
@@ -23,26 +20,27 @@ def register_get_sentiment_tool(app: FastMCP):
             Dictionary with sentiment label and confidence score
         """
         try:
-            # Validate and sanitize input
-            if not text or not text.strip():
+            # Validate and sanitize input. The O(1) length check runs first
+            # so oversized payloads are rejected before any full-text scan.
+            if text and not validate_text_length(text):
                 return {
                     "success": False,
-                    "error": "Empty text provided",
-                    "message": "Please provide text to analyze"
+                    "error": "Text too long",
+                    "message": "Text exceeds maximum length limit"
                 }
             
-            if not validate_text_length(text):
+            if not text or not text.strip():
                 return {
                     "success": False,
-                    "error": "Text too long",
-                    "message": "Text exceeds maximum length limit"
+                    "error": "Empty text provided",
+                    "message": "Please provide text to analyze"
                 }
             
             # Sanitize text
             clean_text = sanitize_text(text)
             
             # Perform sentiment analysis
-            sentiment_result = await sentiment_service.analyze_sentiment(clean_text)
+            sentiment_result = await get_sentiment_service().analyze_sentiment(clean_text)
             
             return {
                 "success": True,
@@ -52,7 +50,7 @@ def register_get_sentiment_tool(app: FastMCP):
             }
             
         except Exception as e:
-            logger.error(f"Error in get_sentiment: {e}")
+            logger.error("Error in get_sentiment: %s", e)
             return {
                 "success": False,
                 "error": "Analysis failed",
@@ -1,11 +1,15 @@
+from typing import List
 from fastmcp import FastMCP
-from services.document_service import DocumentService
+from pydantic import TypeAdapter
+from models.document import DocumentSummary
+from services.registry import get_document_service
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Initialize services
-document_service = DocumentService()
+# Built once: serializes a whole result list in a single call
+_SUMMARY_LIST_ADAPTER = TypeAdapter(List[DocumentSummary])
 
 def register_search_documents_tool(app: FastMCP):
     """Register the search_documents tool with the FastMCP app"""
@@ -30,19 +34,11 @@ def register_search_documents_tool(app: FastMCP):
                     "message": "Please provide a search query"
                 }
             
-            # Perform search
-            matching_documents = document_service.search_documents(query.strip())
+            # Perform search (off the event loop: a cold cache re-reads the file)
+            matching_documents = await asyncio.to_thread(get_document_service().search_documents, query.strip())
             
             # Format results
-            results = []
-            for doc_summary in matching_documents:
-                results.append({
-                    "document_id": doc_summary.document_id,
-                    "title": doc_summary.title,
-                    "author": doc_summary.author,
-                    "category": doc_summary.category,
-                    "matched": doc_summary.matched
-                })
+            results = _SUMMARY_LIST_ADAPTER.dump_python(matching_documents)
             
             return {
                 "success": True,
@@ -53,7 +49,7 @@ def register_search_documents_tool(app: FastMCP):
             }
             
         except Exception as e:
-            logger.error(f"Error in search_documents: {e}")
+            logger.error("Error in search_documents: %s", e)
             return {
                 "success": False,
                 "error": "Search failed",
@@ -1,51 +1,213 @@
-import json
 import os
-from typing import List, Dict, Any, Optional
+import re
+import threading
+from bisect import bisect_left
+from typing import List, Dict, Any, Optional, Set
 from models.document import Document
+from pydantic import TypeAdapter
+import json
 import uuid
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is unavailable
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+# Validates/serializes the whole document list in one pydantic-core call
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[Document])
+
+# Tokens used by the search index
+_TOKEN_RE = re.compile(r'\w+')
+
+# Joins a document's fields into one search haystack; never part of a token
+_FIELD_SEPARATOR = "\x1f"
+
 class DocumentStorage:
     """Handles document storage and retrieval from JSON file"""
     
     def __init__(self, file_path: str = "data/documents.json"):
         self.file_path = file_path
+        self._lock = threading.Lock()
+        
+        # Parsed documents, valid while the file's mtime is unchanged
+        self._cache: Optional[List[Document]] = None
+        self._by_id: Dict[str, Document] = {}
+        # Search index: lowercased haystack per document and token -> positions
+        self._haystacks: List[str] = []
+        self._index: Dict[str, Set[int]] = {}
+        # Sorted tokens and sorted reversed tokens for prefix/suffix lookups,
+        # rebuilt on first search after the vocabulary grows
+        self._prefixes: Optional[List[str]] = None
+        self._suffixes: Optional[List[str]] = None
+        self._cache_mtime_ns: Optional[int] = None
         self._ensure_file_exists()
     
     def _ensure_file_exists(self):
         """Create the documents file if it doesn't exist"""
         if not os.path.exists(self.file_path):
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-            with open(self.file_path, 'w') as f:
-                json.dump([], f)
+            with open(self.file_path, 'wb') as f:
+                f.write(b"[]")
     
-    def load_documents(self) -> List[Document]:
-        """Load all documents from the JSON file"""
+    def _set_cache(self, documents: List[Document], mtime_ns: Optional[int]):
+        """Replace the in-memory copy and its ID index"""
+        self._cache = []
+        self._by_id = {}
+        self._haystacks = []
+        self._index = {}
+        self._prefixes = None
+        self._suffixes = None
+        self._cache_mtime_ns = mtime_ns
+        for doc in documents:
+            self._cache_document(doc)
+    
+    def _cache_document(self, doc: Document):
+        """Append one document to the in-memory copy and index it"""
+        position = len(self._cache)
+        self._cache.append(doc)
+        self._by_id[doc.document_id] = doc
+        
+        haystack = _FIELD_SEPARATOR.join((doc.title, doc.author, doc.text, doc.category)).lower()
+        self._haystacks.append(haystack)
+        for token in _TOKEN_RE.findall(haystack):
+            postings = self._index.get(token)
+            if postings is None:
+                postings = self._index[token] = set()
+                self._prefixes = None
+                self._suffixes = None
+            postings.add(position)
+    
+    @staticmethod
+    def _starting_with(sorted_tokens: List[str], prefix: str) -> List[str]:
+        """Tokens of a sorted list that start with prefix"""
+        start = bisect_left(sorted_tokens, prefix)
+        end = start
+        while end < len(sorted_tokens) and sorted_tokens[end].startswith(prefix):
+            end += 1
+        return sorted_tokens[start:end]
+    
+    def _postings(self, word: str, bounded_left: bool, bounded_right: bool) -> Optional[Set[int]]:
+        """Positions of documents with a token that can hold this query word
+        
+        A word with non-word characters on both sides in the query must be
+        a whole token; one open at the end must start a token and one open
+        at the start must end a token. None when the word is open on both
+        sides, since it may fall anywhere inside a token.
+        """
+        if bounded_left and bounded_right:
+            return self._index.get(word, set())
+        
+        if bounded_left:
+            if self._prefixes is None:
+                self._prefixes = sorted(self._index)
+            tokens = self._starting_with(self._prefixes, word)
+        elif bounded_right:
+            if self._suffixes is None:
+                self._suffixes = sorted(token[::-1] for token in self._index)
+            tokens = [token[::-1] for token in self._starting_with(self._suffixes, word[::-1])]
+        else:
+            return None
+        
+        postings = set()
+        for token in tokens:
+            postings |= self._index[token]
+        return postings
+    
+    def _candidates(self, query_lower: str) -> Optional[Set[int]]:
+        """Positions of documents that can contain the query, or None to scan all
+        
+        Each query word is looked up by how the query bounds it, so
+        intersecting the per-word postings gives a superset of the real
+        matches.
+        """
+        candidates = None
+        for match in _TOKEN_RE.finditer(query_lower):
+            postings = self._postings(
+                match.group(),
+                bounded_left=match.start() > 0,
+                bounded_right=match.end() < len(query_lower)
+            )
+            if postings is None:
+                continue
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                break
+        return candidates
+    
+    def _load_cached(self) -> List[Document]:
+        """Return the parsed documents, re-reading the file only if it changed"""
+        try:
+            mtime_ns = os.stat(self.file_path).st_mtime_ns
+        except FileNotFoundError:
+            self._set_cache([], None)
+            return self._cache
+        
+        if self._cache is not None and mtime_ns == self._cache_mtime_ns:
+            return self._cache
+        
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [Document(**doc) for doc in data]
+            with open(self.file_path, 'rb') as f:
+                data = _loads(f.read())
+            documents = _DOCUMENT_LIST_ADAPTER.validate_python(data)
         except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            documents = []
+        self._set_cache(documents, mtime_ns)
+        return self._cache
+    
+    def load_documents(self) -> List[Document]:
+        """Load all documents from the JSON file"""
+        with self._lock:
+            return list(self._load_cached())
+    
+    def _write_file(self, documents: List[Document]) -> int:
+        """Write documents to disk and return the new file mtime"""
+        data = _DOCUMENT_LIST_ADAPTER.dump_python(documents)
+        
+        # Write to a temp file and swap it in so readers never see a partial file
+        tmp_path = f"{self.file_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(data))
+        os.replace(tmp_path, self.file_path)
+        return os.stat(self.file_path).st_mtime_ns
+    
+    def _write(self, documents: List[Document]):
+        """Write documents to disk and remember them as the cached copy"""
+        self._set_cache(documents, self._write_file(documents))
+    
+    def _append(self, new_documents: List[Document]):
+        """Write the current documents plus new ones, indexing only the new ones"""
+        documents = self._load_cached()
+        mtime_ns = self._write_file(documents + new_documents)
+        for doc in new_documents:
+            self._cache_document(doc)
+        self._cache_mtime_ns = mtime_ns
     
     def save_documents(self, documents: List[Document]):
         """Save all documents to the JSON file"""
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            data = [doc.model_dump() for doc in documents]
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with self._lock:
+            self._write(documents)
     
     def get_document(self, document_id: str) -> Optional[Document]:
         """Get a specific document by ID"""
-        documents = self.load_documents()
-        for doc in documents:
-            if doc.document_id == document_id:
-                return doc
-        return None
+        with self._lock:
+            self._load_cached()
+            return self._by_id.get(document_id)
     
-    def add_document(self, document_data: Dict[str, Any]) -> str:
-        """Add a new document and return its ID"""
-        documents = self.load_documents()
-        
+    @staticmethod
+    def _new_document(document_data: Dict[str, Any]) -> Document:
+        """Build a Document with a fresh ID and default creation date"""
         # Generate unique ID
         document_id = f"doc_{str(uuid.uuid4())[:8]}"
         
@@ -55,25 +217,37 @@ class DocumentStorage:
         
         # Create document with ID
         document_data['document_id'] = document_id
-        new_document = Document(**document_data)
+        return Document(**document_data)
+    
+    def add_document(self, document_data: Dict[str, Any]) -> str:
+        """Add a new document and return its ID"""
+        return self.add_documents([document_data])[0]
+    
+    def add_documents(self, batch: List[Dict[str, Any]]) -> List[str]:
+        """Add several documents with a single file write and return their IDs"""
+        new_documents = [self._new_document(document_data) for document_data in batch]
         
         # Add to list and save
-        documents.append(new_document)
-        self.save_documents(documents)
+        with self._lock:
+            self._append(new_documents)
         
-        return document_id
+        return [doc.document_id for doc in new_documents]
     
     def search_documents(self, query: str) -> List[Document]:
         """Search documents by title, author, or content"""
-        documents = self.load_documents()
         query_lower = query.lower()
         
-        matching_docs = []
-        for doc in documents:
-            if (query_lower in doc.title.lower() or 
-                query_lower in doc.author.lower() or 
-                query_lower in doc.text.lower() or
-                query_lower in doc.category.lower()):
-                matching_docs.append(doc)
+        with self._lock:
+            documents = self._load_cached()
+            candidates = self._candidates(query_lower)
+            positions = range(len(documents)) if candidates is None else sorted(candidates)
+            
+            # Confirm the substring match on the (few) candidate documents;
+            # a query holding the separator could span two fields, so it never matches
+            matching_docs = []
+            if _FIELD_SEPARATOR not in query_lower:
+                for position in positions:
+                    if query_lower in self._haystacks[position]:
+                        matching_docs.append(documents[position])
         
         return matching_docs
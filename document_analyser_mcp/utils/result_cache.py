@@ -0,0 +1,103 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import orjson
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class ResultCache:
+    """Content-hash keyed cache for analysis results
+
+    Results are looked up in an in-memory LRU first, then in a SQLite
+    database (WAL mode) so they survive server restarts. get and set block
+    on SQLite, so async callers run them with asyncio.to_thread.
+    """
+
+    def __init__(self, path: str = Config.CACHE_FILE, memory_size: int = 1024):
+        self.path = path
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(kind: str, model: str, text: str) -> str:
+        """Build the cache key for a (kind, model, text) triple"""
+        return hashlib.sha256(f"{kind}|{model}|{text}".encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite database on first use"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(hash TEXT PRIMARY KEY, kind TEXT, payload BLOB)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, key: str, value: Any):
+        """Insert into the in-memory LRU, evicting the oldest entry if full"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, kind: str, model: str, text: str) -> Optional[Any]:
+        """Return the cached payload for this text, or None on a miss"""
+        key = self.make_key(kind, model, text)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            try:
+                row = self._connect().execute(
+                    "SELECT payload FROM results WHERE hash = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Result cache read failed: %s", e)
+                return None
+
+            if row is None:
+                return None
+
+            value = orjson.loads(row[0])
+            self._remember(key, value)
+            return value
+
+    def set(self, kind: str, model: str, text: str, value: Any):
+        """Store a JSON-serializable payload for this text"""
+        key = self.make_key(kind, model, text)
+        with self._lock:
+            self._remember(key, value)
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR IGNORE INTO results (hash, kind, payload) VALUES (?, ?, ?)",
+                    (key, kind, orjson.dumps(value))
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Result cache write failed: %s", e)
+
+_instance = None
+
+def get_result_cache() -> ResultCache:
+    """Return the shared ResultCache, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = ResultCache()
+    return _instance
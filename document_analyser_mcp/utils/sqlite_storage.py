@@ -0,0 +1,165 @@
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from models.document import Document
+from pydantic import TypeAdapter
+import orjson
+
+_COLUMNS = ("document_id", "title", "author", "created_at", "category", "text")
+_SELECT_COLUMNS = ", ".join(f"d.{column}" for column in _COLUMNS)
+_QUERY_TOKEN_RE = re.compile(r'\w+')
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[Document])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    rowid INTEGER PRIMARY KEY,
+    document_id TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    category TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, author, text, category,
+    content='documents', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts(rowid, title, author, text, category)
+    VALUES (new.rowid, new.title, new.author, new.text, new.category);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, title, author, text, category)
+    VALUES ('delete', old.rowid, old.title, old.author, old.text, old.category);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, title, author, text, category)
+    VALUES ('delete', old.rowid, old.title, old.author, old.text, old.category);
+    INSERT INTO documents_fts(rowid, title, author, text, category)
+    VALUES (new.rowid, new.title, new.author, new.text, new.category);
+END;
+"""
+
+class SQLiteDocumentStorage:
+    """Handles document storage in SQLite (WAL mode) with an FTS5 search index
+
+    Drop-in alternative to DocumentStorage. The JSON file is only used to seed
+    an empty database and as an export target.
+    """
+
+    def __init__(self, db_path: str = "data/documents.sqlite", json_path: str = "data/documents.json"):
+        self.db_path = db_path
+        self.json_path = json_path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._seed_from_json()
+
+    def _seed_from_json(self):
+        """Import documents from the JSON file when the database is empty"""
+        if self._conn.execute("SELECT 1 FROM documents LIMIT 1").fetchone():
+            return
+        if not os.path.exists(self.json_path):
+            return
+        try:
+            with open(self.json_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        except orjson.JSONDecodeError:
+            return
+        self.save_documents(_DOCUMENT_LIST_ADAPTER.validate_python(data))
+
+    @staticmethod
+    def _row_to_document(row) -> Document:
+        return Document.model_construct(**dict(zip(_COLUMNS, row)))
+
+    def load_documents(self) -> List[Document]:
+        """Load all documents"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_SELECT_COLUMNS} FROM documents d ORDER BY d.rowid"
+            ).fetchall()
+        return [self._row_to_document(row) for row in rows]
+
+    def save_documents(self, documents: List[Document]):
+        """Replace all stored documents"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents")
+            self._conn.executemany(
+                f"INSERT INTO documents ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                [tuple(getattr(doc, column) for column in _COLUMNS) for doc in documents]
+            )
+
+    def export_json(self, file_path: Optional[str] = None):
+        """Write all documents to a JSON file"""
+        data = _DOCUMENT_LIST_ADAPTER.dump_python(self.load_documents())
+        with open(file_path or self.json_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+    def get_document(self, document_id: str) -> Optional[Document]:
+        """Get a specific document by ID"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_SELECT_COLUMNS} FROM documents d WHERE d.document_id = ?",
+                (document_id,)
+            ).fetchone()
+        return self._row_to_document(row) if row else None
+
+    @staticmethod
+    def _new_document(document_data: Dict[str, Any]) -> Document:
+        """Build a Document with a fresh ID and default creation date"""
+        # Generate unique ID
+        document_id = f"doc_{str(uuid.uuid4())[:8]}"
+
+        # Set creation date if not provided
+        if 'created_at' not in document_data or not document_data['created_at']:
+            document_data['created_at'] = datetime.now().strftime("%Y-%m-%d")
+
+        # Create document with ID
+        document_data['document_id'] = document_id
+        return Document(**document_data)
+
+    def add_document(self, document_data: Dict[str, Any]) -> str:
+        """Add a new document and return its ID"""
+        return self.add_documents([document_data])[0]
+
+    def add_documents(self, batch: List[Dict[str, Any]]) -> List[str]:
+        """Add several documents in one transaction and return their IDs"""
+        new_documents = [self._new_document(document_data) for document_data in batch]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO documents ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                [tuple(getattr(doc, column) for column in _COLUMNS) for doc in new_documents]
+            )
+
+        return [doc.document_id for doc in new_documents]
+
+    def search_documents(self, query: str) -> List[Document]:
+        """Search documents by title, author, content, or category
+
+        The query is matched as a phrase whose last word may be a prefix,
+        so "health" also finds "healthcare".
+        """
+        tokens = _QUERY_TOKEN_RE.findall(query)
+        if not tokens:
+            return []
+        match = '"' + " ".join(tokens) + '" *'
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_SELECT_COLUMNS} FROM documents_fts "
+                f"JOIN documents d ON d.rowid = documents_fts.rowid "
+                f"WHERE documents_fts MATCH ? ORDER BY rank",
+                (match,)
+            ).fetchall()
+        return [self._row_to_document(row) for row in rows]
@@ -0,0 +1,21 @@
+from functools import lru_cache
+from typing import List, NamedTuple
+import re
+
+_WORD_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+
+class TextFeatures(NamedTuple):
+    """Tokenization shared by the readability and stats analyses"""
+    words_lower: List[str]      # Lowercased alphabetic words (apostrophes kept)
+    sentence_count: int         # Runs of sentence-ending punctuation, at least 1
+    whitespace_word_count: int  # Whitespace-delimited tokens
+
+@lru_cache(maxsize=32)
+def featurize(text: str) -> TextFeatures:
+    """Tokenize the text once; repeated calls for the same text are free"""
+    return TextFeatures(
+        words_lower=_WORD_RE.findall(text.lower()),
+        sentence_count=len(_SENTENCE_END_RE.findall(text)) or 1,
+        whitespace_word_count=len(text.split())
+    )
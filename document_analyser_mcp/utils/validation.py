@@ -1,32 +1,32 @@
+from functools import lru_cache
 from typing import Optional
 import re
 
+_DOC_ID_RE = re.compile(r'^doc_[a-zA-Z0-9]{8}$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_WS_RE = re.compile(r'\s+')
+
 def validate_text_length(text: str, max_length: int = 10000) -> bool:
     """Validate text length is within acceptable limits"""
     return len(text) <= max_length
 
 def validate_document_id(document_id: str) -> bool:
     """Validate document ID format"""
-    pattern = r'^doc_[a-zA-Z0-9]{8}$'
-    return bool(re.match(pattern, document_id))
+    return bool(_DOC_ID_RE.match(document_id))
 
+@lru_cache(maxsize=4096)
 def sanitize_text(text: str) -> str:
-    """Basic text sanitization"""
+    """Basic text sanitization (memoized: the same text often repeats across tools)"""
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     # Strip leading/trailing whitespace
     text = text.strip()
     return text
 
 def validate_keyword_limit(limit: int) -> int:
     """Validate and normalize keyword limit"""
-    if limit < 1:
-        return 1
-    if limit > 20:
-        return 20
-    return limit
+    return 1 if limit < 1 else 20 if limit > 20 else limit
 
 def validate_date_format(date_str: str) -> bool:
     """Validate date format YYYY-MM-DD"""
-    pattern = r'^\d{4}-\d{2}-\d{2}$'
-    return bool(re.match(pattern, date_str))
+    return bool(_DATE_RE.match(date_str))
@@ -3,9 +3,13 @@
 Script to create a comprehensive meeting dataset with 60+ meetings
 """
 
-import json
+import orjson
 from datetime import datetime, timedelta
-import random
+
+import numpy as np
+
+# UTC timestamp format used throughout the meeting data
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 def create_comprehensive_meetings():
     """Create 60+ meetings with realistic data"""
@@ -84,45 +88,60 @@ def create_comprehensive_meetings():
     # Generate meetings for 3 weeks
     start_date = datetime(2024, 12, 16)
     meetings = []
+    count = 40  # Generate 40 more meetings
+    
+    locations = ["Virtual - Zoom", "Virtual - Teams", "Conference Room A", "Conference Room B", "Meeting Room 1", "Meeting Room 2"]
+    recurrence_patterns = [None, "weekly", "bi_weekly", "monthly"]
+    
+    # Draw all randomness up front in a few vectorized calls
+    rng = np.random.default_rng()
+    template_idx = rng.integers(0, len(templates), size=count)
+    days_offsets = rng.integers(0, 21, size=count)  # Spread across 3 weeks
+    hours = rng.integers(9, 17, size=count)  # Business hours
+    minutes = rng.choice([0, 30], size=count)
+    effectiveness_scores = np.round(rng.uniform(7.0, 9.5, size=count), 1)
+    participant_counts = np.array([len(t["participants"]) for t in templates])[template_idx]
+    organizer_idx = rng.integers(0, participant_counts)
+    location_idx = rng.integers(0, len(locations), size=count)
+    recurring_flags = rng.integers(0, 2, size=count).astype(bool)
+    has_pattern = rng.integers(0, 2, size=count).astype(bool)
+    pattern_idx = rng.integers(0, len(recurrence_patterns), size=count)
+    created_offsets = rng.integers(1, 15, size=count)
+    updated_offsets = rng.integers(0, 8, size=count)
+    
+    draws = zip(
+        template_idx.tolist(), days_offsets.tolist(), hours.tolist(), minutes.tolist(),
+        effectiveness_scores.tolist(), organizer_idx.tolist(), location_idx.tolist(),
+        recurring_flags.tolist(), has_pattern.tolist(), pattern_idx.tolist(),
+        created_offsets.tolist(), updated_offsets.tolist()
+    )
     
-    for i in range(40):  # Generate 40 more meetings
-        template = random.choice(templates)
+    for i, (t_idx, days_offset, hour, minute, effectiveness, o_idx, l_idx,
+            recurring, patterned, p_idx, created_offset, updated_offset) in enumerate(draws):
+        template = templates[t_idx]
         meeting_id = f"meet_{26 + i:03d}"
         
-        # Spread across 3 weeks
-        days_offset = random.randint(0, 20)
         meeting_date = start_date + timedelta(days=days_offset)
-        
-        # Random time during business hours
-        hour = random.randint(9, 16)
-        minute = random.choice([0, 30])
-        
         start_time = meeting_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
         end_time = start_time + timedelta(minutes=template["duration"])
         
-        # Random effectiveness score
-        effectiveness = round(random.uniform(7.0, 9.5), 1)
-        
-        # Random organizer from participants
-        organizer = random.choice(template["participants"])
-        
         meeting = {
             "meeting_id": meeting_id,
             "title": template["title"],
             "description": template["description"],
             "participants": template["participants"],
-            "organizer": organizer,
-            "start_time": start_time.isoformat() + "Z",
-            "end_time": end_time.isoformat() + "Z",
+            "organizer": template["participants"][o_idx],
+            "start_time": start_time.strftime(_TIMESTAMP_FORMAT),
+            "end_time": end_time.strftime(_TIMESTAMP_FORMAT),
             "time_zone": "America/New_York",
             "meeting_type": template["meeting_type"],
             "status": "scheduled",
-            "location": random.choice(["Virtual - Zoom", "Virtual - Teams", "Conference Room A", "Conference Room B", "Meeting Room 1", "Meeting Room 2"]),
+            "location": locations[l_idx],
             "agenda": template["agenda"],
-            "recurring": random.choice([True, False]),
-            "recurrence_pattern": random.choice([None, "weekly", "bi_weekly", "monthly"]) if random.choice([True, False]) else None,
-            "created_at": (start_time - timedelta(days=random.randint(1, 14))).isoformat() + "Z",
-            "updated_at": (start_time - timedelta(days=random.randint(0, 7))).isoformat() + "Z",
+            "recurring": recurring,
+            "recurrence_pattern": recurrence_patterns[p_idx] if patterned else None,
+            "created_at": (start_time - timedelta(days=created_offset)).strftime(_TIMESTAMP_FORMAT),
+            "updated_at": (start_time - timedelta(days=updated_offset)).strftime(_TIMESTAMP_FORMAT),
             "effectiveness_score": effectiveness,
             "metadata": {
                 "generated": True,
@@ -140,5 +159,5 @@ def create_comprehensive_meetings():
 
 if __name__ == "__main__":
     meetings = create_comprehensive_meetings()
-    print(json.dumps(meetings, indent=2))
+    print(orjson.dumps(meetings, option=orjson.OPT_INDENT_2).decode())
     print(f"\n# Generated {len(meetings)} additional meetings")
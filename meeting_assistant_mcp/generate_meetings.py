@@ -3,9 +3,13 @@
 Script to generate additional meetings to reach 60+ total meetings
 """
 
-import json
+import orjson
 from datetime import datetime, timedelta
-import random
+
+import numpy as np
+
+# UTC timestamp format used throughout the meeting data
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 # Meeting templates for generating realistic meetings
 meeting_templates = [
@@ -51,44 +55,82 @@ meeting_templates = [
     }
 ]
 
-def generate_meeting(template, meeting_id, start_date):
-    """Generate a meeting based on template"""
-    # Random time between 9 AM and 5 PM
-    hour = random.randint(9, 16)
-    minute = random.choice([0, 30])
-    
-    start_time = start_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    end_time = start_time + timedelta(minutes=template["duration"])
-    
-    # Random effectiveness score between 7.0 and 9.5
-    effectiveness = round(random.uniform(7.0, 9.5), 1)
-    
-    # Random organizer from participants
-    organizer = random.choice(template["participants"])
-    
-    meeting = {
-        "meeting_id": meeting_id,
+LOCATIONS = ["Virtual - Zoom", "Virtual - Teams", "Conference Room A", "Conference Room B"]
+RECURRENCE_PATTERNS = [None, "weekly", "bi_weekly", "monthly"]
+
+def draw_meeting_values(rng, count):
+    """Draw the random values for ``count`` meetings in vectorized calls"""
+    template_idx = rng.integers(0, len(meeting_templates), size=count)
+    participant_counts = np.array([len(t["participants"]) for t in meeting_templates])[template_idx]
+    columns = {
+        "template_idx": template_idx,
+        "days_offset": rng.integers(0, 14, size=count),
+        # Random time between 9 AM and 5 PM
+        "hour": rng.integers(9, 17, size=count),
+        "minute": rng.choice([0, 30], size=count),
+        # Random effectiveness score between 7.0 and 9.5
+        "effectiveness": np.round(rng.uniform(7.0, 9.5, size=count), 1),
+        # Random organizer from participants
+        "organizer_idx": rng.integers(0, participant_counts),
+        "location_idx": rng.integers(0, len(LOCATIONS), size=count),
+        "recurring": rng.integers(0, 2, size=count).astype(bool),
+        "has_pattern": rng.integers(0, 2, size=count).astype(bool),
+        "pattern_idx": rng.integers(0, len(RECURRENCE_PATTERNS), size=count),
+        "created_offset": rng.integers(1, 15, size=count),
+        "updated_offset": rng.integers(0, 8, size=count),
+    }
+    # Convert to Python scalars once so the meeting dicts stay JSON-serializable
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*(columns[name].tolist() for name in names))]
+
+def _meeting_skeleton(template):
+    """Meeting dict with the template's fixed fields, in output key order"""
+    return {
+        "meeting_id": None,
         "title": template["title"],
         "description": template["description"],
         "participants": template["participants"],
-        "organizer": organizer,
-        "start_time": start_time.isoformat() + "Z",
-        "end_time": end_time.isoformat() + "Z",
+        "organizer": None,
+        "start_time": None,
+        "end_time": None,
         "time_zone": "America/New_York",
         "meeting_type": template["meeting_type"],
         "status": "scheduled",
-        "location": random.choice(["Virtual - Zoom", "Virtual - Teams", "Conference Room A", "Conference Room B"]),
+        "location": None,
         "agenda": template["agenda"],
-        "recurring": random.choice([True, False]),
-        "recurrence_pattern": random.choice([None, "weekly", "bi_weekly", "monthly"]) if random.choice([True, False]) else None,
-        "created_at": (start_date - timedelta(days=random.randint(1, 14))).isoformat() + "Z",
-        "updated_at": (start_date - timedelta(days=random.randint(0, 7))).isoformat() + "Z",
-        "effectiveness_score": effectiveness,
-        "metadata": {
+        "recurring": None,
+        "recurrence_pattern": None,
+        "created_at": None,
+        "updated_at": None,
+        "effectiveness_score": None,
+        "metadata": None
+    }
+
+# Built once per template; each meeting copies one and fills in the rest
+_MEETING_SKELETONS = {template["title"]: _meeting_skeleton(template) for template in meeting_templates}
+
+def generate_meeting(template, meeting_id, start_date, values):
+    """Generate a meeting based on template and pre-drawn random values"""
+    start_time = start_date.replace(hour=values["hour"], minute=values["minute"], second=0, microsecond=0)
+    end_time = start_time + timedelta(minutes=template["duration"])
+    
+    meeting = _MEETING_SKELETONS[template["title"]].copy()
+    meeting.update(
+        meeting_id=meeting_id,
+        organizer=template["participants"][values["organizer_idx"]],
+        start_time=start_time.strftime(_TIMESTAMP_FORMAT),
+        end_time=end_time.strftime(_TIMESTAMP_FORMAT),
+        location=LOCATIONS[values["location_idx"]],
+        recurring=values["recurring"],
+        recurrence_pattern=RECURRENCE_PATTERNS[values["pattern_idx"]] if values["has_pattern"] else None,
+        created_at=(start_date - timedelta(days=values["created_offset"])).strftime(_TIMESTAMP_FORMAT),
+        updated_at=(start_date - timedelta(days=values["updated_offset"])).strftime(_TIMESTAMP_FORMAT),
+        effectiveness_score=values["effectiveness"],
+        metadata={
             "generated": True,
             "template": template["title"].lower().replace(" ", "_")
         }
-    }
+    )
     
     return meeting
 
@@ -97,22 +139,23 @@ def main():
     base_date = datetime(2024, 12, 25)
     meetings = []
     
-    for i in range(45):  # Generate 45 more meetings to reach 65 total
-        template = random.choice(meeting_templates)
+    # Generate 45 more meetings to reach 65 total
+    rng = np.random.default_rng()
+    for i, values in enumerate(draw_meeting_values(rng, 45)):
+        template = meeting_templates[values["template_idx"]]
         meeting_id = f"meet_{21 + i:03d}"
         
         # Spread meetings across 2 weeks
-        days_offset = random.randint(0, 13)
-        meeting_date = base_date + timedelta(days=days_offset)
+        meeting_date = base_date + timedelta(days=values["days_offset"])
         
-        meeting = generate_meeting(template, meeting_id, meeting_date)
+        meeting = generate_meeting(template, meeting_id, meeting_date, values)
         meetings.append(meeting)
     
     # Sort by start time
     meetings.sort(key=lambda x: x["start_time"])
     
     # Print JSON for the additional meetings
-    print(json.dumps(meetings, indent=2))
+    print(orjson.dumps(meetings, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
     main()
@@ -6,139 +6,135 @@ An AI-powered meeting scheduling and management system with intelligent optimiza
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import queue
+from collections import Counter
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('meeting_assistant.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging: callers only enqueue records; a background
+# listener thread does the actual file/stream writes
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('meeting_assistant.log')
+_stream_handler = logging.StreamHandler()
+for _handler in (_file_handler, _stream_handler):
+    _handler.setFormatter(_log_formatter)
+
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
 
 logger = logging.getLogger(__name__)
 
-# Import services and tools
-from services.core.calendar_service import CalendarService
-from services.core.user_service import UserService
-from services.ai.optimal_time_service import OptimalTimeService
+# Import services (the MCP tool suite is imported in main() when the server starts)
+from services.registry import get_calendar_service, get_optimal_time_service, get_user_service
 
-# Import all MCP tools
-from tools.meeting_tools import (
-    find_optimal_slots,
-    create_meeting,
-    detect_scheduling_conflicts,
-    analyze_meeting_patterns,
-    generate_agenda_suggestions,
-    calculate_workload_balance,
-    score_meeting_effectiveness,
-    optimize_meeting_schedule,
-    mcp
+# Server metadata that never changes between get_server_info calls (tuples,
+# copied into fresh lists per call so callers can't mutate the shared values)
+_SERVER_NAME = "Smart Meeting Assistant"
+_SERVER_VERSION = "1.0.0"
+_SERVER_CAPABILITIES = (
+    "AI-powered optimal time slot recommendations",
+    "Intelligent conflict detection and resolution", 
+    "Meeting pattern analysis and insights",
+    "Workload balancing across team members",
+    "Smart agenda generation",
+    "Meeting effectiveness scoring",
+    "Schedule optimization recommendations",
+    "Multi-timezone support"
+)
+_SERVER_TOOLS = (
+    "find_optimal_slots",
+    "create_meeting", 
+    "detect_scheduling_conflicts",
+    "analyze_meeting_patterns",
+    "generate_agenda_suggestions",
+    "calculate_workload_balance",
+    "score_meeting_effectiveness",
+    "optimize_meeting_schedule"
 )
 
 class MeetingAssistantServer:
     """Smart Meeting Assistant MCP Server"""
     
     def __init__(self):
-        self.calendar_service = CalendarService("data/meetings.json")
-        self.user_service = UserService("data/users.json")
-        self.optimal_time_service = OptimalTimeService(
-            self.calendar_service, 
-            self.user_service
-        )
+        # The same instances the MCP tools use, so there is one cache per process
+        self.calendar_service = get_calendar_service()
+        self.user_service = get_user_service()
+        self.optimal_time_service = get_optimal_time_service()
         
     async def initialize(self):
         """Initialize the server and load data"""
         logger.info("Initializing Smart Meeting Assistant MCP Server...")
         
-        # Load initial data
-        users = await self.user_service.load_users()
-        meetings = await self.calendar_service.load_meetings()
+        # Load initial data (both files are read concurrently)
+        users, meetings = await asyncio.gather(
+            self.user_service.load_users(),
+            self.calendar_service.load_meetings()
+        )
         
         logger.info(f"Loaded {len(users)} users and {len(meetings)} meetings")
         
         # Verify data integrity
-        await self._verify_data_integrity()
+        await self._verify_data_integrity(users, meetings)
         
         logger.info("Server initialization complete")
         
-    async def _verify_data_integrity(self):
+    async def _verify_data_integrity(self, users, meetings):
         """Verify data integrity and relationships"""
-        users = await self.user_service.load_users()
-        meetings = await self.calendar_service.load_meetings()
-        
         user_ids = {user.user_id for user in users}
         
         # Check for invalid participant references in meetings
-        invalid_participants = 0
-        for meeting in meetings:
-            for participant in meeting.participants:
-                if participant not in user_ids:
-                    invalid_participants += 1
-                    logger.warning(f"Meeting {meeting.meeting_id} references unknown user {participant}")
+        invalid_references = [
+            (meeting.meeting_id, participant)
+            for meeting in meetings
+            for participant in meeting.participants_set - user_ids
+        ]
         
-        if invalid_participants > 0:
-            logger.warning(f"Found {invalid_participants} invalid participant references")
+        if invalid_references:
+            logger.warning(
+                f"Found {len(invalid_references)} invalid participant references: {invalid_references}"
+            )
         else:
             logger.info("Data integrity check passed")
             
     async def get_server_info(self):
         """Get server information and statistics"""
-        users = await self.user_service.load_users()
-        meetings = await self.calendar_service.load_meetings()
+        # The services cache by file mtime, so this only re-reads changed files
+        users, meetings = await asyncio.gather(
+            self.user_service.load_users(),
+            self.calendar_service.load_meetings()
+        )
         
         # Calculate statistics
         total_users = len(users)
         total_meetings = len(meetings)
         
-        # Department distribution
-        departments = {}
-        for user in users:
-            departments[user.department] = departments.get(user.department, 0) + 1
-            
-        # Meeting type distribution
-        meeting_types = {}
-        for meeting in meetings:
-            meeting_types[meeting.meeting_type] = meeting_types.get(meeting.meeting_type, 0) + 1
+        # Department and meeting type distributions
+        departments = dict(Counter(user.department for user in users))
+        meeting_types = dict(Counter(meeting.meeting_type for meeting in meetings))
             
         return {
-            "server_name": "Smart Meeting Assistant",
-            "version": "1.0.0",
+            "server_name": _SERVER_NAME,
+            "version": _SERVER_VERSION,
+            "capabilities": list(_SERVER_CAPABILITIES),
+            "tools": list(_SERVER_TOOLS),
             "status": "running",
             "statistics": {
                 "total_users": total_users,
                 "total_meetings": total_meetings,
                 "departments": departments,
                 "meeting_types": meeting_types
-            },
-            "capabilities": [
-                "AI-powered optimal time slot recommendations",
-                "Intelligent conflict detection and resolution", 
-                "Meeting pattern analysis and insights",
-                "Workload balancing across team members",
-                "Smart agenda generation",
-                "Meeting effectiveness scoring",
-                "Schedule optimization recommendations",
-                "Multi-timezone support"
-            ],
-            "tools": [
-                "find_optimal_slots",
-                "create_meeting", 
-                "detect_scheduling_conflicts",
-                "analyze_meeting_patterns",
-                "generate_agenda_suggestions",
-                "calculate_workload_balance",
-                "score_meeting_effectiveness",
-                "optimize_meeting_schedule"
-            ]
+            }
         }
 
 async def main():
@@ -158,8 +154,16 @@ async def main():
         for tool in info["tools"]:
             logger.info(f"  - {tool}")
             
+        # Import the MCP tools (FastMCP and every tool module) only once the
+        # data is loaded; importing registers the tools on `mcp`
+        from tools.meeting_tools import mcp
+        
         # Run the FastMCP server
-        await mcp.run()
+        try:
+            await mcp.run()
+        finally:
+            # Retry meeting changes whose write failed
+            await server.calendar_service.flush()
         
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
@@ -170,4 +174,11 @@ async def main():
         logger.info("Smart Meeting Assistant MCP Server stopped")
 
 if __name__ == "__main__":
+    # uvloop's faster event loop where available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+        
     asyncio.run(main())
@@ -3,9 +3,15 @@
 Script to merge additional meetings and reach 60+ total
 """
 
-import json
-from datetime import datetime, timedelta
-import random
+import orjson
+from datetime import datetime, timezone
+from operator import itemgetter
+
+import numpy as np
+
+def _format_epochs(epochs):
+    """Format UTC epoch seconds as ISO timestamps with a trailing Z"""
+    return [f"{s}Z" for s in np.datetime_as_string(epochs.astype("datetime64[s]"), unit="s").tolist()]
 
 def create_additional_meetings():
     """Create additional meetings to reach 60+ total"""
@@ -56,50 +62,73 @@ def create_additional_meetings():
     
     # Generate 40 more meetings
     meetings = []
-    start_date = datetime(2024, 12, 26)  # Start after existing meetings
+    # Start after existing meetings
+    base_epoch = int(datetime(2024, 12, 26, tzinfo=timezone.utc).timestamp())
+    count = 40
+    
+    locations = ["Virtual - Zoom", "Virtual - Teams", "Conference Room A", "Conference Room B"]
+    recurrence_patterns = [None, "weekly", "bi_weekly", "monthly"]
+    
+    # Draw all randomness up front in a few vectorized calls
+    rng = np.random.default_rng()
+    template_idx = rng.integers(0, len(templates), size=count)
+    days_offsets = rng.integers(0, 21, size=count)  # Spread across 3 weeks
+    hours = rng.integers(9, 17, size=count)  # Business hours
+    minutes = rng.choice([0, 30], size=count)
+    effectiveness_scores = np.round(rng.uniform(7.0, 9.5, size=count), 1)
+    participant_counts = np.array([len(t["participants"]) for t in templates])[template_idx]
+    organizer_idx = rng.integers(0, participant_counts)
+    location_idx = rng.integers(0, len(locations), size=count)
+    recurring_flags = rng.integers(0, 2, size=count).astype(bool)
+    has_pattern = rng.integers(0, 2, size=count).astype(bool)
+    pattern_idx = rng.integers(0, len(recurrence_patterns), size=count)
+    created_offsets = rng.integers(1, 15, size=count)
+    updated_offsets = rng.integers(0, 8, size=count)
+    
+    # Do the timestamp arithmetic in epoch seconds for all meetings at once,
+    # then format every column in one call
+    durations = np.array([t["duration"] for t in templates])[template_idx]
+    start_epochs = base_epoch + days_offsets * 86400 + hours * 3600 + minutes * 60
+    start_times = _format_epochs(start_epochs)
+    end_times = _format_epochs(start_epochs + durations * 60)
+    created_times = _format_epochs(start_epochs - created_offsets * 86400)
+    updated_times = _format_epochs(start_epochs - updated_offsets * 86400)
+    
+    # Template slugs computed once, not per meeting
+    template_slugs = [t["title"].lower().replace(" ", "_") for t in templates]
+    
+    draws = zip(
+        template_idx.tolist(), effectiveness_scores.tolist(), organizer_idx.tolist(),
+        location_idx.tolist(), recurring_flags.tolist(), has_pattern.tolist(), pattern_idx.tolist(),
+        start_times, end_times, created_times, updated_times
+    )
 
-    for i in range(40):
-        template = random.choice(templates)
+    for i, (t_idx, effectiveness, o_idx, l_idx, recurring, patterned, p_idx,
+            start_time, end_time, created_at, updated_at) in enumerate(draws):
+        template = templates[t_idx]
         meeting_id = f"meet_{26 + i:03d}"
         
-        # Spread across 3 weeks
-        days_offset = random.randint(0, 20)
-        meeting_date = start_date + timedelta(days=days_offset)
-        
-        # Random time during business hours
-        hour = random.randint(9, 16)
-        minute = random.choice([0, 30])
-        
-        start_time = meeting_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        end_time = start_time + timedelta(minutes=template["duration"])
-        
-        # Random effectiveness score
-        effectiveness = round(random.uniform(7.0, 9.5), 1)
-        
-        # Random organizer from participants
-        organizer = random.choice(template["participants"])
-        
         meeting = {
             "meeting_id": meeting_id,
             "title": template["title"],
             "description": template["description"],
             "participants": template["participants"],
-            "organizer": organizer,
-            "start_time": start_time.isoformat() + "Z",
-            "end_time": end_time.isoformat() + "Z",
+            "organizer": template["participants"][o_idx],
+            "start_time": start_time,
+            "end_time": end_time,
             "time_zone": "America/New_York",
             "meeting_type": template["meeting_type"],
             "status": "scheduled",
-            "location": random.choice(["Virtual - Zoom", "Virtual - Teams", "Conference Room A", "Conference Room B"]),
+            "location": locations[l_idx],
             "agenda": template["agenda"],
-            "recurring": random.choice([True, False]),
-            "recurrence_pattern": random.choice([None, "weekly", "bi_weekly", "monthly"]) if random.choice([True, False]) else None,
-            "created_at": (start_time - timedelta(days=random.randint(1, 14))).isoformat() + "Z",
-            "updated_at": (start_time - timedelta(days=random.randint(0, 7))).isoformat() + "Z",
+            "recurring": recurring,
+            "recurrence_pattern": recurrence_patterns[p_idx] if patterned else None,
+            "created_at": created_at,
+            "updated_at": updated_at,
             "effectiveness_score": effectiveness,
             "metadata": {
                 "generated": True,
-                "template": template["title"].lower().replace(" ", "_"),
+                "template": template_slugs[t_idx],
                 "batch": "additional_40"
             }
         }
@@ -111,23 +140,24 @@ def create_additional_meetings():
 def main():
     # Load existing meetings
     try:
-        with open('data/meetings.json', 'r') as f:
-            existing_meetings = json.load(f)
+        with open('data/meetings.json', 'rb') as f:
+            existing_meetings = orjson.loads(f.read())
     except FileNotFoundError:
         existing_meetings = []
     
     # Generate additional meetings
     additional_meetings = create_additional_meetings()
     
-    # Combine all meetings
-    all_meetings = existing_meetings + additional_meetings
+    # Combine all meetings in place rather than copying both lists
+    all_meetings = existing_meetings
+    all_meetings.extend(additional_meetings)
     
     # Sort by start time
-    all_meetings.sort(key=lambda x: x["start_time"])
+    all_meetings.sort(key=itemgetter("start_time"))
     
     # Save combined meetings
-    with open('data/meetings.json', 'w') as f:
-        json.dump(all_meetings, f, indent=2)
+    with open('data/meetings.json', 'wb') as f:
+        f.write(orjson.dumps(all_meetings, option=orjson.OPT_INDENT_2))
     
     print(f"Total meetings: {len(all_meetings)}")
     print(f"Added {len(additional_meetings)} new meetings")
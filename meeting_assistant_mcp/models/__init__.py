@@ -1,7 +1,7 @@
 from .meeting import Meeting, MeetingCreate, MeetingUpdate
 from .user import User, UserPreferences
 from .analysis import MeetingAnalysis, WorkloadAnalysis, EffectivenessScore
-from .scheduling import TimeSlot, ConflictDetection, OptimalSlot
+from .scheduling import TimeSlot, DateRange, ConflictDetection, OptimalSlot
 
 __all__ = [
     "Meeting",
@@ -13,6 +13,7 @@ __all__ = [
     "WorkloadAnalysis",
     "EffectivenessScore",
     "TimeSlot",
+    "DateRange",
     "ConflictDetection",
     "OptimalSlot"
 ]
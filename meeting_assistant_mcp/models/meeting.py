@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import sys
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -21,6 +22,10 @@ class MeetingStatus(str, Enum):
     RESCHEDULED = "rescheduled"
 
 class Meeting(BaseModel):
+    # Immutable: services replace a meeting with an updated copy instead of mutating it.
+    # Enum fields hold their plain str values, so hashing/comparing them skips Enum machinery.
+    model_config = ConfigDict(frozen=True, use_enum_values=True, validate_default=True)
+    
     meeting_id: str = Field(..., description="Unique meeting identifier")
     title: str = Field(..., description="Meeting title")
     description: Optional[str] = Field(None, description="Meeting description")
@@ -39,6 +44,34 @@ class Meeting(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
     effectiveness_score: Optional[float] = Field(None, description="Meeting effectiveness score (1-10)")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    
+    @field_validator("organizer")
+    @classmethod
+    def _intern_organizer(cls, v: str) -> str:
+        return sys.intern(v)
+        
+    @field_validator("participants")
+    @classmethod
+    def _intern_participants(cls, v: List[str]) -> List[str]:
+        # Shared string objects make user ID hashing/comparison cheap
+        return [sys.intern(p) for p in v]
+        
+    # Participant IDs as a set, built once per (immutable) meeting
+    _participants_set: frozenset = PrivateAttr(default=frozenset())
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._participants_set = frozenset(self.participants)
+        
+    @property
+    def participants_set(self) -> frozenset:
+        """Participant IDs as a set"""
+        return self._participants_set
+        
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Meeting":
+        """Copy the meeting, rebuilding the participant set from the copy's fields"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._participants_set = frozenset(copied.participants)
+        return copied
 
 class MeetingCreate(BaseModel):
     title: str = Field(..., description="Meeting title")
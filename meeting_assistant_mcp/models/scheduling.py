@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -18,6 +18,23 @@ class TimeSlot(BaseModel):
     available_participants: List[str] = Field(..., description="Available participant IDs")
     unavailable_participants: List[str] = Field(default_factory=list, description="Unavailable participant IDs")
 
+class DateRange(BaseModel):
+    # Parsed and validated by pydantic-core when a tool's arguments are decoded
+    model_config = ConfigDict(frozen=True)
+    
+    start: datetime = Field(..., description="Range start (ISO format)")
+    end: datetime = Field(..., description="Range end (ISO format)")
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _from_pair(cls, v: Any) -> Any:
+        # Tools have always taken the range as a [start, end] list
+        if isinstance(v, (list, tuple)):
+            if len(v) != 2:
+                raise ValueError("date range must be [start, end]")
+            return {"start": v[0], "end": v[1]}
+        return v
+
 class ConflictDetection(BaseModel):
     user_id: str = Field(..., description="User ID with conflict")
     conflict_type: ConflictType = Field(..., description="Type of conflict")
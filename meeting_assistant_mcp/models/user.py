@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import sys
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import time
 from enum import Enum
@@ -20,6 +21,9 @@ class ProductivityPeriod(str, Enum):
     EVENING = "evening"              # 6-9 PM
 
 class UserPreferences(BaseModel):
+    # Enum fields hold their plain str values (still equal to the enum members)
+    model_config = ConfigDict(frozen=True, use_enum_values=True, validate_default=True)
+    
     time_zone: str = Field(..., description="User's primary time zone")
     working_hours_start: time = Field(..., description="Start of working hours")
     working_hours_end: time = Field(..., description="End of working hours")
@@ -37,6 +41,9 @@ class UserPreferences(BaseModel):
     avoid_back_to_back: bool = Field(default=True, description="Avoid back-to-back meetings")
 
 class User(BaseModel):
+    # Immutable: services replace a user with an updated copy instead of mutating it
+    model_config = ConfigDict(frozen=True)
+    
     user_id: str = Field(..., description="Unique user identifier")
     name: str = Field(..., description="User's full name")
     email: str = Field(..., description="User's email address")
@@ -47,3 +54,34 @@ class User(BaseModel):
     is_active: bool = Field(default=True, description="Is user active")
     created_at: str = Field(..., description="User creation date")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional user metadata")
+    
+    @field_validator("user_id", "manager_id", "department")
+    @classmethod
+    def _intern_ids(cls, v: Optional[str]) -> Optional[str]:
+        # Repeated IDs/departments share one string object, so hashing and
+        # equality checks against them are cheap
+        return sys.intern(v) if v is not None else v
+        
+    # Department and role, lower-cased once for case-insensitive lookups
+    _department_lower: str = PrivateAttr(default="")
+    _role_lower: str = PrivateAttr(default="")
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._department_lower = self.department.lower()
+        self._role_lower = self.role.lower()
+        
+    @property
+    def department_lower(self) -> str:
+        """Department, lower-cased for case-insensitive lookups"""
+        return self._department_lower
+        
+    @property
+    def role_lower(self) -> str:
+        """Role, lower-cased for case-insensitive lookups"""
+        return self._role_lower
+        
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "User":
+        """Copy the user, rebuilding the lower-cased fields from the copy's values"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.model_post_init(None)
+        return copied
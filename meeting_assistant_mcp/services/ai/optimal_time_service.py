@@ -5,19 +5,103 @@ This service implements the AI-powered optimal time slot recommendation algorith
 that analyzes multiple factors to suggest the best meeting times for all participants.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta, time
-import pytz
+import asyncio
+from itertools import groupby
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+from datetime import datetime, timedelta, time, timezone
+import numpy as np
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
+from zoneinfo import ZoneInfo
 
 from ...models.scheduling import OptimalSlot, TimeSlot
 from ...models.user import User, ProductivityPeriod
-from ..core.calendar_service import CalendarService
-from ..core.user_service import UserService
+from ..core.calendar_service import CalendarService, epoch_microseconds, get_calendar_service
+from ..core.user_service import UserService, get_user_service
 
 logger = logging.getLogger(__name__)
 
+# Local hour range [start, end) and score for each productive period
+_PRODUCTIVE_PERIOD_SCORES = {
+    ProductivityPeriod.EARLY_MORNING: (6, 9, 9.0),
+    ProductivityPeriod.MORNING: (9, 12, 9.5),
+    ProductivityPeriod.AFTERNOON: (12, 15, 8.5),
+    ProductivityPeriod.LATE_AFTERNOON: (15, 18, 8.0),
+    ProductivityPeriod.EVENING: (18, 21, 7.0)
+}
+
+# Convenience score by local hour: penalize very early or very late times
+_HOUR_CONVENIENCE = np.array([
+    8.0 - (8 - hour) * 1.5 if hour < 8 else 8.0 - (hour - 17) * 1.0 if hour > 17 else 8.0
+    for hour in range(24)
+])
+
+def _score_kernel(
+    local_seconds: np.ndarray,
+    hour_scores: np.ndarray,
+    no_before: np.ndarray,
+    no_after: np.ndarray,
+    weekdays: np.ndarray,
+    free_block_days: np.ndarray,
+    weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Average productivity, convenience and preference score per slot
+    
+    Pure array math over the (slots x groups) grid of local times: per-group
+    hour tables and limits come in as arrays, so nothing here touches models.
+    Each group counts `weights` times towards the participant average.
+    """
+    local_hours = (local_seconds // 3600).astype(np.intp)
+    
+    # All three per-(slot, group) scores go into one block so they are
+    # averaged, capped and handed back in a single pass
+    components = np.empty((3,) + local_seconds.shape)
+    productivity, convenience, preference = components
+    
+    productivity[...] = np.take_along_axis(hour_scores.T, local_hours, axis=0)
+    
+    convenience[...] = _HOUR_CONVENIENCE[local_hours]
+    convenience -= 3.0 * (local_seconds < no_before)
+    convenience -= 3.0 * (local_seconds > no_after)
+    np.maximum(convenience, 1.0, out=convenience)
+    
+    preference[...] = 8.0 - free_block_days[:, weekdays].T * 2.0
+    
+    averages = np.minimum(components @ weights / weights.sum(), 10.0)
+    return averages[0], averages[1], averages[2]
+
+def _overall_scores(
+    productivity: np.ndarray,
+    convenience: np.ndarray,
+    conflict_risk: np.ndarray,
+    preference: np.ndarray
+) -> np.ndarray:
+    """ScoreComponents.overall_score for every slot at once (same weights and order)"""
+    return productivity * 0.4 + convenience * 0.3 + conflict_risk * 0.2 + preference * 0.1
+
+class _UserScoreTables(NamedTuple):
+    """Scoring inputs, parsed from preferences once per search
+    
+    Participants whose scores can only ever be equal (same timezone and
+    scoring preferences) share a row; `weights` counts them.
+    """
+    time_zones: List[str]
+    hour_scores: np.ndarray  # (groups, 24) productivity score by local hour
+    no_before: np.ndarray  # local seconds of day; -inf when unset
+    no_after: np.ndarray  # local seconds of day; inf when unset
+    free_block_days: np.ndarray  # (groups, 7) penalized meeting-free blocks by weekday
+    weights: np.ndarray  # participants per group
+
+@lru_cache(maxsize=None)
+def _get_timezone(name: str) -> ZoneInfo:
+    """Timezone by name, built once per name instead of per slot and user"""
+    return ZoneInfo(name)
+
+def _local_to_utc(date, local_time: time, tz: ZoneInfo) -> datetime:
+    """UTC instant of a local wall-clock time on the given date"""
+    return datetime.combine(date, local_time, tzinfo=tz).astimezone(timezone.utc)
+
 @dataclass
 class ScoreComponents:
     """Components of the optimization score"""
@@ -78,13 +162,36 @@ class OptimalTimeService:
             logger.warning("No common availability windows found")
             return []
             
-        # Score each potential time slot
-        scored_slots = []
-        for window in availability_windows:
-            score_components = await self._calculate_slot_score(window, users, duration)
+        # Parse participant preferences once for every scoring pass below
+        tables = self._build_score_tables(users)
+        
+        # Score the (chronological) candidates a day at a time, keeping a running
+        # top 5 by overall score (a stable sort, so ties keep their order). Scores
+        # stay as columns, one row per component, aligned with the windows.
+        # Once the 5th best reaches the highest score any slot could get, later
+        # days can't displace it: stop there.
+        upper_bound = self._score_upper_bound(tables)
+        top_windows: List[TimeSlot] = []
+        top_scores = np.empty((4, 0))
+        for _, day_windows in groupby(availability_windows, key=lambda window: window.start_time.date()):
+            day_windows = list(day_windows)
+            day_scores = np.vstack(await self._calculate_slot_scores(day_windows, users, tables))
             
-            optimal_slot = OptimalSlot(
-                rank=0,  # Will be set after sorting
+            windows = top_windows + day_windows
+            scores = np.hstack((top_scores, day_scores))
+            overall = _overall_scores(*scores)
+            keep = np.argsort(-overall, kind="stable")[:5]
+            top_windows = [windows[i] for i in keep.tolist()]
+            top_scores = scores[:, keep]
+            if len(top_windows) == 5 and overall[keep[-1]] >= upper_bound:
+                break
+        
+        # Explanations and participant impact are only needed for the slots returned
+        top_slots = []
+        for i, (window, column) in enumerate(zip(top_windows, top_scores.T.tolist())):
+            score_components = ScoreComponents(*column)
+            top_slots.append(OptimalSlot(
+                rank=i + 1,
                 time_slot=window,
                 overall_score=score_components.overall_score,
                 productivity_score=score_components.productivity_score,
@@ -94,24 +201,22 @@ class OptimalTimeService:
                 explanation=self._generate_explanation(score_components, users),
                 participant_impact=await self._calculate_participant_impact(window, users),
                 reasoning=self._generate_detailed_reasoning(score_components)
-            )
-            
-            scored_slots.append(optimal_slot)
+            ))
             
-        # Sort by overall score (descending) and assign ranks
-        scored_slots.sort(key=lambda x: x.overall_score, reverse=True)
-        for i, slot in enumerate(scored_slots):
-            slot.rank = i + 1
-            
-        # Return top 5 recommendations
-        return scored_slots[:5]
+        return top_slots
         
     async def _get_participant_data(self, participant_ids: List[str]) -> List[User]:
         """Get user data for all participants"""
+        results = await asyncio.gather(
+            *(self.user_service.get_user(user_id) for user_id in participant_ids),
+            return_exceptions=True
+        )
+        
         users = []
-        for user_id in participant_ids:
-            user = await self.user_service.get_user(user_id)
-            if user:
+        for user_id, user in zip(participant_ids, results):
+            if isinstance(user, Exception):
+                logger.warning(f"Error loading user {user_id}: {user}")
+            elif user:
                 users.append(user)
             else:
                 logger.warning(f"User {user_id} not found")
@@ -158,15 +263,17 @@ class OptimalTimeService:
         common_start = None
         common_end = None
         
-        for user in users:
-            user_tz = pytz.timezone(user.preferences.time_zone)
+        # Participants sharing a timezone and working hours are converted once
+        working_hours = {
+            (user.preferences.time_zone, user.preferences.working_hours_start, user.preferences.working_hours_end)
+            for user in users
+        }
+        for time_zone, working_hours_start, working_hours_end in working_hours:
+            user_tz = _get_timezone(time_zone)
             
             # Convert working hours to UTC
-            user_start = datetime.combine(date, user.preferences.working_hours_start)
-            user_end = datetime.combine(date, user.preferences.working_hours_end)
-            
-            user_start_utc = user_tz.localize(user_start).astimezone(pytz.UTC)
-            user_end_utc = user_tz.localize(user_end).astimezone(pytz.UTC)
+            user_start_utc = _local_to_utc(date, working_hours_start, user_tz)
+            user_end_utc = _local_to_utc(date, working_hours_end, user_tz)
             
             if common_start is None or user_start_utc > common_start:
                 common_start = user_start_utc
@@ -176,172 +283,271 @@ class OptimalTimeService:
         if not common_start or not common_end or common_end <= common_start:
             return []
             
-        # Generate 30-minute time slots within the common window
-        current_time = common_start
+        # Generate 30-minute time slots within the free gaps of the common window
         slot_duration = timedelta(minutes=duration)
+        step = timedelta(minutes=30)  # 30-minute increments
+        participant_ids = [user.user_id for user in users]
         
-        while current_time + slot_duration <= common_end:
-            # Check if all participants are actually free at this time
-            all_available = await self._check_availability_at_time(users, current_time, duration)
+        busy_intervals = await self._get_busy_intervals(users, date, common_start, common_end)
+        for gap_start, gap_end in self._free_gaps(busy_intervals, common_start, common_end):
+            # First 30-minute step from common_start that falls inside the gap
+            steps_in = -((common_start - gap_start) // step)
+            current_time = common_start + steps_in * step
             
-            if all_available:
+            while current_time + slot_duration <= gap_end:
                 time_slot = TimeSlot(
                     start_time=current_time,
                     end_time=current_time + slot_duration,
                     duration_minutes=duration,
-                    available_participants=[user.user_id for user in users],
+                    available_participants=participant_ids,
                     unavailable_participants=[]
                 )
                 daily_windows.append(time_slot)
+                current_time += step
                 
-            current_time += timedelta(minutes=30)  # 30-minute increments
-            
         return daily_windows
         
+    async def _get_busy_intervals(
+        self,
+        users: List[User],
+        date: datetime.date,
+        window_start: datetime,
+        window_end: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """All participants' meetings and lunch breaks in the window, sorted by start"""
+        # Existing meetings, fetched once per user for the whole window
+        all_user_meetings = await asyncio.gather(*(
+            self.calendar_service.get_user_meetings(user.user_id, window_start, window_end)
+            for user in users
+        ))
+        
+        intervals = []
+        for user, user_meetings in zip(users, all_user_meetings):
+            intervals.extend((meeting.start_time, meeting.end_time) for meeting in user_meetings)
+            
+            # Lunch break on this date, converted to UTC
+            lunch = self._lunch_interval_utc(user, date)
+            if lunch:
+                intervals.append(lunch)
+                
+        intervals.sort(key=lambda interval: interval[0])
+        return intervals
+        
+    @staticmethod
+    def _free_gaps(
+        busy_intervals: List[Tuple[datetime, datetime]],
+        window_start: datetime,
+        window_end: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """Sweep the sorted busy intervals and return the free gaps in the window"""
+        gaps = []
+        busy_end = window_start
+        
+        for start, end in busy_intervals:
+            if start > busy_end:
+                gaps.append((busy_end, min(start, window_end)))
+            busy_end = max(busy_end, end)
+            if busy_end >= window_end:
+                break
+                
+        if busy_end < window_end:
+            gaps.append((busy_end, window_end))
+            
+        return gaps
+        
     async def _check_availability_at_time(
         self,
         users: List[User],
         start_time: datetime,
-        duration: int
+        duration: int,
+        mode: str = "all"
     ) -> bool:
-        """Check if all users are available at the specified time"""
+        """Check if the users are available at the specified time
+        
+        mode="all" requires every user to be free; mode="any" (round-robin
+        scheduling) is satisfied by the first free user found.
+        """
+        if mode not in ("all", "any"):
+            raise ValueError(f"Unknown availability mode: {mode}")
+            
         end_time = start_time + timedelta(minutes=duration)
         
-        for user in users:
-            # Check for existing meetings
-            user_meetings = await self.calendar_service.get_user_meetings(
-                user.user_id, start_time, end_time
-            )
+        # Lunch breaks need no lookups, so check them first
+        candidates = [user for user in users if not self._overlaps_lunch(user, start_time, end_time)]
+        if mode == "all" and len(candidates) < len(users):
+            return False
+        if not candidates:
+            return False
             
-            if user_meetings:
-                return False
-                
-            # Check lunch break conflicts
-            if user.preferences.lunch_break_start and user.preferences.lunch_break_end:
-                user_tz = pytz.timezone(user.preferences.time_zone)
-                user_local_start = start_time.astimezone(user_tz).time()
-                user_local_end = end_time.astimezone(user_tz).time()
-                
-                lunch_start = user.preferences.lunch_break_start
-                lunch_end = user.preferences.lunch_break_end
+        # Check for existing meetings
+        if mode == "all":
+            all_user_meetings = await asyncio.gather(*(
+                self.calendar_service.get_user_meetings(user.user_id, start_time, end_time)
+                for user in candidates
+            ))
+            return not any(all_user_meetings)
+            
+        # Any mode: return as soon as one lookup comes back empty
+        pending = {
+            asyncio.ensure_future(self.calendar_service.get_user_meetings(user.user_id, start_time, end_time))
+            for user in candidates
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(not task.result() for task in done):
+                    return True
+            return False
+        finally:
+            for task in pending:
+                task.cancel()
                 
-                # Check if meeting overlaps with lunch
-                if (user_local_start < lunch_end and user_local_end > lunch_start):
-                    return False
-                    
-        return True
+    @staticmethod
+    def _lunch_interval_utc(user: User, date: datetime.date) -> Optional[Tuple[datetime, datetime]]:
+        """The user's lunch break on a local date as a UTC interval, if they have one"""
+        if not (user.preferences.lunch_break_start and user.preferences.lunch_break_end):
+            return None
+            
+        user_tz = _get_timezone(user.preferences.time_zone)
+        return (
+            _local_to_utc(date, user.preferences.lunch_break_start, user_tz),
+            _local_to_utc(date, user.preferences.lunch_break_end, user_tz)
+        )
+        
+    def _overlaps_lunch(self, user: User, start_time: datetime, end_time: datetime) -> bool:
+        """Whether a meeting at this time would overlap the user's lunch break"""
+        # Same UTC interval the availability sweep treats as busy
+        local_date = start_time.astimezone(_get_timezone(user.preferences.time_zone)).date()
+        lunch = self._lunch_interval_utc(user, local_date)
+        return bool(lunch) and start_time < lunch[1] and end_time > lunch[0]
         
-    async def _calculate_slot_score(
+    async def _calculate_slot_scores(
         self,
-        time_slot: TimeSlot,
+        time_slots: List[TimeSlot],
         users: List[User],
-        duration: int
-    ) -> ScoreComponents:
-        """Calculate comprehensive score for a time slot"""
+        tables: _UserScoreTables
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate comprehensive scores for all candidate time slots
         
-        productivity_score = await self._calculate_productivity_score(time_slot, users)
-        convenience_score = await self._calculate_convenience_score(time_slot, users)
-        conflict_risk_score = await self._calculate_conflict_risk_score(time_slot, users)
-        preference_score = await self._calculate_preference_score(time_slot, users)
+        Returns productivity, convenience, conflict risk and preference score
+        arrays, in ScoreComponents field order.
+        """
+        productivity, convenience, preference = self._score_slots(time_slots, tables)
+        conflict_risk = await self._calculate_conflict_risk_scores(time_slots, users)
+        return productivity, convenience, conflict_risk, preference
         
-        return ScoreComponents(
-            productivity_score=productivity_score,
-            convenience_score=convenience_score,
-            conflict_risk_score=conflict_risk_score,
-            preference_score=preference_score
+    def _build_score_tables(self, users: List[User]) -> _UserScoreTables:
+        """Parse participants' scoring preferences into lookup arrays"""
+        # Group participants that score identically and keep one representative each
+        groups: Dict[tuple, List[User]] = {}
+        for user in users:
+            prefs = user.preferences
+            key = (
+                prefs.time_zone,
+                frozenset(prefs.productive_periods),
+                prefs.no_meetings_before,
+                prefs.no_meetings_after,
+                sum("Friday" in block for block in prefs.meeting_free_blocks)
+            )
+            groups.setdefault(key, []).append(user)
+        representatives = [members[0].preferences for members in groups.values()]
+        
+        # Productivity: hour -> score from the user's productive periods
+        hour_scores = np.full((len(representatives), 24), 5.0)  # Base score
+        for i, prefs in enumerate(representatives):
+            for period in prefs.productive_periods:
+                start_hour, end_hour, score = _PRODUCTIVE_PERIOD_SCORES[period]
+                hour_scores[i, start_hour:end_hour] = score
+                
+        # Convenience: the user's meeting limits as local seconds (unbounded if unset)
+        no_before = np.array([
+            self._seconds_of_day(prefs.no_meetings_before) if prefs.no_meetings_before else -np.inf
+            for prefs in representatives
+        ])
+        no_after = np.array([
+            self._seconds_of_day(prefs.no_meetings_after) if prefs.no_meetings_after else np.inf
+            for prefs in representatives
+        ])
+        
+        # Preference: meeting-free blocks by weekday
+        # Simplified check - in real implementation, parse time blocks
+        free_block_days = np.zeros((len(representatives), 7))
+        free_block_days[:, 4] = [key[-1] for key in groups]
+        
+        return _UserScoreTables(
+            time_zones=[prefs.time_zone for prefs in representatives],
+            hour_scores=hour_scores,
+            no_before=no_before,
+            no_after=no_after,
+            free_block_days=free_block_days,
+            weights=np.array([len(members) for members in groups.values()], dtype=float)
         )
         
-    async def _calculate_productivity_score(self, time_slot: TimeSlot, users: List[User]) -> float:
-        """Calculate productivity score based on users' productive periods"""
-        total_score = 0.0
+    @staticmethod
+    def _score_upper_bound(tables: _UserScoreTables) -> float:
+        """Highest overall score any slot could get with these participants"""
+        # Best productive hour for every participant; convenience, conflict
+        # risk and preference scores never exceed 8.0
+        best_productivity = tables.hour_scores.max(axis=1) @ tables.weights / tables.weights.sum()
+        return ScoreComponents(
+            productivity_score=min(best_productivity, 10.0),
+            convenience_score=8.0,
+            conflict_risk_score=8.0,
+            preference_score=8.0
+        ).overall_score
         
-        for user in users:
-            user_tz = pytz.timezone(user.preferences.time_zone)
-            local_time = time_slot.start_time.astimezone(user_tz).time()
-            hour = local_time.hour
-            
-            # Score based on productive periods
-            user_score = 5.0  # Base score
-            
-            for period in user.preferences.productive_periods:
-                if period == ProductivityPeriod.EARLY_MORNING and 6 <= hour < 9:
-                    user_score = 9.0
-                elif period == ProductivityPeriod.MORNING and 9 <= hour < 12:
-                    user_score = 9.5
-                elif period == ProductivityPeriod.AFTERNOON and 12 <= hour < 15:
-                    user_score = 8.5
-                elif period == ProductivityPeriod.LATE_AFTERNOON and 15 <= hour < 18:
-                    user_score = 8.0
-                elif period == ProductivityPeriod.EVENING and 18 <= hour < 21:
-                    user_score = 7.0
-                    
-            total_score += user_score
-            
-        return min(total_score / len(users), 10.0)
+    def _score_slots(
+        self,
+        time_slots: List[TimeSlot],
+        tables: _UserScoreTables
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Productivity, convenience and preference scores for every slot
         
-    async def _calculate_convenience_score(self, time_slot: TimeSlot, users: List[User]) -> float:
-        """Calculate convenience score based on time zones and preferences"""
-        total_score = 0.0
+        Each slot start is converted to each group's local time once; the
+        scoring itself is elementwise math over the (slots x groups) grid.
+        """
+        # Local time of day (seconds) per (slot, group)
+        time_zones = [_get_timezone(name) for name in tables.time_zones]
+        local_seconds = np.array([
+            [self._seconds_of_day(time_slot.start_time.astimezone(tz)) for tz in time_zones]
+            for time_slot in time_slots
+        ], dtype=float).reshape(len(time_slots), len(time_zones))
+        weekdays = np.array([time_slot.start_time.weekday() for time_slot in time_slots], dtype=np.intp)
         
-        for user in users:
-            user_tz = pytz.timezone(user.preferences.time_zone)
-            local_time = time_slot.start_time.astimezone(user_tz).time()
-            hour = local_time.hour
-            
-            user_score = 8.0  # Base score
-            
-            # Penalize very early or very late times
-            if hour < 8:
-                user_score -= (8 - hour) * 1.5
-            elif hour > 17:
-                user_score -= (hour - 17) * 1.0
-                
-            # Bonus for preferred times
-            if user.preferences.no_meetings_before:
-                if local_time < user.preferences.no_meetings_before:
-                    user_score -= 3.0
-                    
-            if user.preferences.no_meetings_after:
-                if local_time > user.preferences.no_meetings_after:
-                    user_score -= 3.0
-                    
-            total_score += max(user_score, 1.0)
-            
-        return min(total_score / len(users), 10.0)
+        return _score_kernel(
+            local_seconds, tables.hour_scores, tables.no_before, tables.no_after,
+            weekdays, tables.free_block_days, tables.weights
+        )
         
-    async def _calculate_conflict_risk_score(self, time_slot: TimeSlot, users: List[User]) -> float:
-        """Calculate conflict risk score"""
+    @staticmethod
+    def _seconds_of_day(value) -> float:
+        """Seconds since midnight of a time or datetime"""
+        return value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+        
+    async def _calculate_conflict_risk_scores(
+        self,
+        time_slots: List[TimeSlot],
+        users: List[User]
+    ) -> np.ndarray:
+        """Calculate conflict risk scores for every slot"""
         # This is a simplified implementation
         # In a real system, this would analyze meeting density, buffer times, etc.
         base_score = 8.0
         
-        # Check for meetings close to this time slot
-        for user in users:
-            nearby_meetings = await self.calendar_service.get_nearby_meetings(
-                user.user_id, time_slot.start_time, buffer_minutes=30
+        # Count each user's meetings within 30 minutes either side of every slot
+        buffer_us = 30 * 60 * 1_000_000
+        slot_starts = np.array(
+            [epoch_microseconds(time_slot.start_time) for time_slot in time_slots], dtype=np.int64
+        )
+        nearby_counts = await asyncio.gather(*(
+            self.calendar_service.count_user_meetings_overlapping(
+                user.user_id, slot_starts - buffer_us, slot_starts + buffer_us
             )
-            
-            if nearby_meetings:
-                base_score -= len(nearby_meetings) * 0.5
-                
-        return max(base_score, 1.0)
+            for user in users
+        ))
         
-    async def _calculate_preference_score(self, time_slot: TimeSlot, users: List[User]) -> float:
-        """Calculate preference alignment score"""
-        total_score = 0.0
-        
-        for user in users:
-            user_score = 8.0
-            
-            # Check meeting-free blocks
-            for block in user.preferences.meeting_free_blocks:
-                # Simplified check - in real implementation, parse time blocks
-                if "Friday" in block and time_slot.start_time.weekday() == 4:
-                    user_score -= 2.0
-                    
-            total_score += user_score
-            
-        return min(total_score / len(users), 10.0)
+        total_nearby = np.sum(nearby_counts, axis=0)
+        return np.maximum(base_score - total_nearby * 0.5, 1.0)
         
     async def _calculate_participant_impact(
         self,
@@ -352,7 +558,7 @@ class OptimalTimeService:
         impact = {}
         
         for user in users:
-            user_tz = pytz.timezone(user.preferences.time_zone)
+            user_tz = _get_timezone(user.preferences.time_zone)
             local_time = time_slot.start_time.astimezone(user_tz)
             
             # Determine impact level
@@ -411,3 +617,12 @@ class OptimalTimeService:
                 "preferences": "10%"
             }
         }
+
+_instance = None
+
+def get_optimal_time_service() -> OptimalTimeService:
+    """Return the shared OptimalTimeService (over the shared calendar and user services)"""
+    global _instance
+    if _instance is None:
+        _instance = OptimalTimeService(get_calendar_service(), get_user_service())
+    return _instance
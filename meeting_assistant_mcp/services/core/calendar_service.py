@@ -4,74 +4,265 @@ Calendar Service
 Core service for managing meeting data and calendar operations.
 """
 
-import json
+import asyncio
 import os
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from collections import defaultdict
+from typing import List, Optional, Dict, Any, NamedTuple
+from datetime import datetime, timedelta, timezone
 import logging
 
+import numpy as np
+import orjson
+from pydantic import TypeAdapter
+
+# Streaming parser for very large calendars (optional)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from ...models.meeting import Meeting, MeetingCreate, MeetingUpdate, MeetingStatus
 
 logger = logging.getLogger(__name__)
 
+# Built once; validates a whole file of meetings without per-item constructor calls
+_MEETING_LIST_ADAPTER = TypeAdapter(List[Meeting])
+
+# Files above this size are parsed item by item (when ijson is installed) so
+# the raw file and the full parse never have to be in memory together
+_STREAMING_PARSE_BYTES = 64 * 1024 * 1024
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+def epoch_microseconds(value: datetime) -> int:
+    """Exact microseconds since the Unix epoch (naive datetimes are taken as UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+class _UserTimeline(NamedTuple):
+    """A participant's meetings sorted by start time, with array copies of their times"""
+    meetings: List[Meeting]
+    # Structure-of-arrays copy in epoch microseconds: sorted start times, the
+    # end times in the same (start) order for range queries, and the end
+    # times sorted independently for vectorized overlap counts
+    start_us: np.ndarray
+    ends_by_start_us: np.ndarray
+    end_us: np.ndarray
+
 class CalendarService:
     """Core calendar service for meeting management"""
     
     def __init__(self, data_file: str = "data/meetings.json"):
         self.data_file = data_file
         self._meetings_cache: Optional[List[Meeting]] = None
+        # File mtime the cache was loaded at; a change on disk forces a re-read
+        self._meetings_mtime_ns: Optional[int] = None
+        
+        # Indexes over the cached meetings: rebuilt when the cache is replaced,
+        # updated meeting by meeting when it is mutated
+        self._by_id: Dict[str, Meeting] = {}
+        self._by_user: Dict[str, List[Meeting]] = {}  # In cache order
+        self._timelines: Dict[str, _UserTimeline] = {}
+        self._max_duration = timedelta(0)
+        # Highest N among "meet_N" IDs; new meetings take the next number
+        self._max_meeting_num = 0
         
+        # In-memory changes not yet written to the data file, and the write
+        # that concurrent mutations are currently waiting on
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Future] = None
+        
+    def _file_mtime_ns(self) -> Optional[int]:
+        """Modification time of the data file, or None if it is missing"""
+        try:
+            return os.stat(self.data_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+            
     async def load_meetings(self) -> List[Meeting]:
         """Load meetings from JSON file"""
-        if self._meetings_cache is not None:
+        mtime_ns = self._file_mtime_ns()
+        if self._meetings_cache is not None and (self._dirty or mtime_ns == self._meetings_mtime_ns):
+            # Unflushed changes win over whatever is on disk
             return self._meetings_cache
             
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    meetings_data = json.load(f)
-                    
-                self._meetings_cache = [
-                    Meeting(**meeting_data) for meeting_data in meetings_data
-                ]
+            if mtime_ns is not None:
+                # Read and validate off the event loop so concurrent loads can overlap
+                meetings = await asyncio.to_thread(self._read_data_file)
             else:
                 logger.warning(f"Meetings file {self.data_file} not found")
-                self._meetings_cache = []
+                meetings = []
                 
         except Exception as e:
             logger.error(f"Error loading meetings: {e}")
-            self._meetings_cache = []
+            meetings = []
             
+        self._set_cache(meetings, mtime_ns)
         return self._meetings_cache
         
+    def _set_cache(self, meetings: List[Meeting], mtime_ns: Optional[int]):
+        """Remember meetings as the cached copy and rebuild the lookup indexes"""
+        self._meetings_cache = meetings
+        self._meetings_mtime_ns = mtime_ns
+        
+        by_id: Dict[str, Meeting] = {}
+        by_user: Dict[str, List[Meeting]] = defaultdict(list)
+        max_duration = timedelta(0)
+        max_meeting_num = 0
+        for meeting in meetings:
+            by_id.setdefault(meeting.meeting_id, meeting)
+            prefix, _, number = meeting.meeting_id.partition("_")
+            if prefix == "meet" and number.isdigit():
+                max_meeting_num = max(max_meeting_num, int(number))
+            for participant in meeting.participants_set:
+                by_user[participant].append(meeting)
+            max_duration = max(max_duration, meeting.end_time - meeting.start_time)
+            
+        self._by_id = by_id
+        self._by_user = dict(by_user)
+        self._max_duration = max_duration
+        self._max_meeting_num = max_meeting_num
+        self._timelines = {
+            user_id: self._build_timeline(user_meetings)
+            for user_id, user_meetings in self._by_user.items()
+        }
+        
+    @staticmethod
+    def _build_timeline(user_meetings: List[Meeting]) -> _UserTimeline:
+        """Sort one participant's meetings by start and copy their times into arrays"""
+        timeline = sorted(user_meetings, key=lambda m: m.start_time)
+        ends_by_start_us = np.array([epoch_microseconds(m.end_time) for m in timeline], dtype=np.int64)
+        return _UserTimeline(
+            timeline,
+            np.array([epoch_microseconds(m.start_time) for m in timeline], dtype=np.int64),
+            ends_by_start_us,
+            np.sort(ends_by_start_us)
+        )
+        
+    def _refresh_timelines(self, user_ids):
+        """Rebuild the timelines of just these participants"""
+        for user_id in user_ids:
+            user_meetings = self._by_user.get(user_id)
+            if user_meetings:
+                self._timelines[user_id] = self._build_timeline(user_meetings)
+            else:
+                self._by_user.pop(user_id, None)
+                self._timelines.pop(user_id, None)
+                
+    def _index_added(self, meeting: Meeting):
+        """Index a meeting appended to the end of the cache"""
+        self._by_id.setdefault(meeting.meeting_id, meeting)
+        for participant in meeting.participants_set:
+            self._by_user.setdefault(participant, []).append(meeting)
+        self._max_duration = max(self._max_duration, meeting.end_time - meeting.start_time)
+        self._refresh_timelines(meeting.participants_set)
+        
+    def _index_replaced(self, old: Meeting, new: Meeting):
+        """Swap an updated meeting into the indexes in place of its old version"""
+        if self._by_id.get(old.meeting_id) is old:
+            self._by_id[new.meeting_id] = new
+        for participant in old.participants_set & new.participants_set:
+            user_meetings = self._by_user[participant]
+            user_meetings[next(i for i, m in enumerate(user_meetings) if m is old)] = new
+        for participant in old.participants_set - new.participants_set:
+            self._by_user[participant] = [m for m in self._by_user[participant] if m is not old]
+        for participant in new.participants_set - old.participants_set:
+            # Rare: rescan the cache so the participant's list stays in cache order
+            self._by_user[participant] = [m for m in self._meetings_cache if participant in m.participants_set]
+        # The longest duration is only ever raised; a stale, larger value just
+        # widens get_user_meetings' lookback
+        self._max_duration = max(self._max_duration, new.end_time - new.start_time)
+        self._refresh_timelines(old.participants_set | new.participants_set)
+        
+    def _index_removed(self, meeting: Meeting):
+        """Drop a meeting already removed from the cache from the indexes"""
+        if self._by_id.get(meeting.meeting_id) is meeting:
+            # A later meeting with the same ID (if any) becomes the one found by ID
+            del self._by_id[meeting.meeting_id]
+            duplicate = next((m for m in self._meetings_cache if m.meeting_id == meeting.meeting_id), None)
+            if duplicate is not None:
+                self._by_id[meeting.meeting_id] = duplicate
+        for participant in meeting.participants_set:
+            self._by_user[participant] = [m for m in self._by_user[participant] if m is not meeting]
+        self._refresh_timelines(meeting.participants_set)
+        
+    def _read_data_file(self) -> List[Meeting]:
+        """Parse and validate the meetings JSON file in one pydantic-core pass
+        
+        Very large files are streamed and validated one meeting at a time.
+        """
+        with open(self.data_file, 'rb') as f:
+            if ijson is not None and os.fstat(f.fileno()).st_size > _STREAMING_PARSE_BYTES:
+                return [
+                    Meeting.model_validate(item)
+                    for item in ijson.items(f, 'item', use_float=True)
+                ]
+            return _MEETING_LIST_ADAPTER.validate_json(f.read())
+            
     async def save_meetings(self, meetings: List[Meeting]) -> bool:
         """Save meetings to JSON file"""
+        self._dirty = False
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
             
-            meetings_data = [meeting.model_dump() for meeting in meetings]
+            # Serialize and write off the event loop; meetings are frozen, so a
+            # shallow copy of the list is a stable snapshot to hand over
+            await asyncio.to_thread(self._write_data_file, list(meetings))
             
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(meetings_data, f, indent=2, default=str)
-                
-            self._meetings_cache = meetings
+            if meetings is self._meetings_cache:
+                # Writing the cache back out: its indexes are already current
+                self._meetings_mtime_ns = self._file_mtime_ns()
+            else:
+                self._set_cache(meetings, self._file_mtime_ns())
             logger.info(f"Saved {len(meetings)} meetings to {self.data_file}")
             return True
             
         except Exception as e:
             logger.error(f"Error saving meetings: {e}")
+            self._dirty = True
             return False
             
+    async def flush(self) -> bool:
+        """Write pending in-memory changes to the data file
+        
+        Callers arriving while a write is running wait for it, then share
+        one follow-up write for the changes it did not include, so a burst
+        of mutations still costs about two file writes.
+        """
+        while self._dirty:
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.ensure_future(self.save_meetings(self._meetings_cache))
+            if not await asyncio.shield(self._flush_task):
+                return False
+        return True
+        
+    def _write_data_file(self, meetings: List[Meeting]):
+        """Serialize meetings and write them to the JSON file"""
+        meetings_data = _MEETING_LIST_ADAPTER.dump_python(meetings)
+        
+        # Naive timestamps (e.g. the models' utcnow() defaults) are written as UTC,
+        # matching the data file's "...Z" convention
+        blob = orjson.dumps(
+            meetings_data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        )
+        
+        # Write a temporary file and swap it in, so an interrupted write never
+        # leaves a truncated data file behind
+        tmp_file = f"{self.data_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_file, self.data_file)
+            
     async def get_meeting(self, meeting_id: str) -> Optional[Meeting]:
         """Get a specific meeting by ID"""
-        meetings = await self.load_meetings()
-        
-        for meeting in meetings:
-            if meeting.meeting_id == meeting_id:
-                return meeting
-                
-        return None
+        await self.load_meetings()
+        return self._by_id.get(meeting_id)
         
     async def get_user_meetings(
         self,
@@ -80,22 +271,61 @@ class CalendarService:
         end_time: Optional[datetime] = None
     ) -> List[Meeting]:
         """Get meetings for a specific user within a time range"""
-        meetings = await self.load_meetings()
-        user_meetings = []
+        await self.load_meetings()
+        timeline = self._timelines.get(user_id)
+        if timeline is None:
+            return []
+            
+        # Filter by time range if provided: meetings starting before end_time,
+        # from the first one that could still be running at start_time, then
+        # a vectorized end-time mask over just that span
+        hi = len(timeline.meetings)
+        if end_time:
+            hi = int(np.searchsorted(timeline.start_us, epoch_microseconds(end_time), side='left'))
+        if start_time:
+            start_us = epoch_microseconds(start_time)
+            lo = int(np.searchsorted(
+                timeline.start_us[:hi], start_us - self._max_duration // _MICROSECOND, side='right'
+            ))
+            running = np.flatnonzero(timeline.ends_by_start_us[lo:hi] > start_us) + lo
+            return [timeline.meetings[i] for i in running.tolist()]
+            
+        return timeline.meetings[:hi]
         
-        for meeting in meetings:
-            if user_id in meeting.participants:
-                # Filter by time range if provided
-                if start_time and meeting.end_time <= start_time:
-                    continue
-                if end_time and meeting.start_time >= end_time:
-                    continue
-                    
-                user_meetings.append(meeting)
-                
-        # Sort by start time
-        user_meetings.sort(key=lambda m: m.start_time)
-        return user_meetings
+    async def get_overlapping_meetings(
+        self,
+        user_id: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Meeting]:
+        """Get the user's meetings that overlap [start_time, end_time)
+        
+        Both bounds go through the sorted-start search and end-time mask, so
+        every meeting returned starts before end_time and ends after start_time.
+        """
+        return await self.get_user_meetings(user_id, start_time, end_time)
+        
+    async def count_user_meetings_overlapping(
+        self,
+        user_id: str,
+        range_starts: np.ndarray,
+        range_ends: np.ndarray
+    ) -> np.ndarray:
+        """Number of the user's meetings overlapping each [start, end) range
+        
+        Ranges are given in epoch microseconds. A meeting overlaps when it
+        starts before the range ends and ends after it starts, so the count
+        is (meetings starting before the end) - (meetings ended by the start).
+        """
+        await self.load_meetings()
+        timeline = self._timelines.get(user_id)
+        if timeline is None:
+            return np.zeros(len(range_starts), dtype=np.int64)
+            
+        return (
+            np.searchsorted(timeline.start_us, range_ends, side='left') -
+            np.searchsorted(timeline.end_us, range_starts, side='right')
+        )
         
     async def get_nearby_meetings(
         self,
@@ -115,11 +345,8 @@ class CalendarService:
         meetings = await self.load_meetings()
         
         # Generate new meeting ID
-        existing_ids = {m.meeting_id for m in meetings}
-        counter = 1
-        while f"meet_{counter:03d}" in existing_ids:
-            counter += 1
-        new_id = f"meet_{counter:03d}"
+        self._max_meeting_num += 1
+        new_id = f"meet_{self._max_meeting_num:03d}"
         
         # Create meeting object
         meeting = Meeting(
@@ -128,8 +355,8 @@ class CalendarService:
             description=meeting_data.description,
             participants=meeting_data.participants,
             organizer=organizer_id,
-            start_time=datetime.utcnow(),  # Will be set by scheduling logic
-            end_time=datetime.utcnow() + timedelta(minutes=meeting_data.duration),
+            start_time=datetime.now(timezone.utc),  # Will be set by scheduling logic
+            end_time=datetime.now(timezone.utc) + timedelta(minutes=meeting_data.duration),
             time_zone=meeting_data.preferences.get("time_zone", "UTC"),
             meeting_type=meeting_data.meeting_type,
             status=MeetingStatus.SCHEDULED,
@@ -141,7 +368,9 @@ class CalendarService:
         )
         
         meetings.append(meeting)
-        await self.save_meetings(meetings)
+        self._index_added(meeting)
+        self._dirty = True
+        await self.flush()
         
         logger.info(f"Created meeting {new_id}: {meeting.title}")
         return meeting
@@ -152,16 +381,18 @@ class CalendarService:
         
         for i, meeting in enumerate(meetings):
             if meeting.meeting_id == meeting_id:
-                # Apply updates
+                # Apply updates (meetings are frozen, so swap in an updated copy)
                 update_data = updates.model_dump(exclude_unset=True)
-                for field, value in update_data.items():
-                    setattr(meeting, field, value)
-                    
-                meeting.updated_at = datetime.utcnow()
+                update_data["updated_at"] = datetime.now(timezone.utc)
+                # Re-validated rather than model_copy'd so the updated fields are validated
+                updated = Meeting(**{**meeting.model_dump(), **update_data})
+                meetings[i] = updated
+                self._index_replaced(meeting, updated)
                 
-                await self.save_meetings(meetings)
+                self._dirty = True
+                await self.flush()
                 logger.info(f"Updated meeting {meeting_id}")
-                return meeting
+                return updated
                 
         logger.warning(f"Meeting {meeting_id} not found for update")
         return None
@@ -173,7 +404,9 @@ class CalendarService:
         for i, meeting in enumerate(meetings):
             if meeting.meeting_id == meeting_id:
                 meetings.pop(i)
-                await self.save_meetings(meetings)
+                self._index_removed(meeting)
+                self._dirty = True
+                await self.flush()
                 logger.info(f"Deleted meeting {meeting_id}")
                 return True
                 
@@ -191,11 +424,11 @@ class CalendarService:
         results = []
         query_lower = query.lower()
         
+        # Filter by user if specified
+        if user_id:
+            meetings = self._by_user.get(user_id, [])
+            
         for meeting in meetings:
-            # Filter by user if specified
-            if user_id and user_id not in meeting.participants:
-                continue
-                
             # Search in title, description, and agenda
             searchable_text = " ".join([
                 meeting.title.lower(),
@@ -247,5 +480,19 @@ class CalendarService:
         }
         
     def clear_cache(self):
-        """Clear the meetings cache"""
+        """Clear the meetings cache (unflushed changes are discarded)"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._dirty = False
+        self._set_cache([], None)
         self._meetings_cache = None
+
+_instance = None
+
+def get_calendar_service() -> CalendarService:
+    """Return the shared CalendarService, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = CalendarService()
+    return _instance
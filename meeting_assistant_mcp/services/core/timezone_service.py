@@ -5,12 +5,88 @@ Service for handling time zone conversions and calculations.
 """
 
 import pytz
-from datetime import datetime, time
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import logging
+from collections import Counter
+from dataclasses import dataclass
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Fairness score (0-10) by local hour: business hours 9-17 are perfect,
+# dropping off an hour either side down to unreasonable hours
+_HOUR_SCORE = (1,) * 6 + (4, 6, 8) + (10,) * 9 + (8, 6, 4) + (1,) * 3
+_IMPACT_BY_SCORE = {10: "excellent", 8: "good", 6: "fair", 4: "poor", 1: "poor"}
+_HOUR_SCORE_ARRAY = np.array(_HOUR_SCORE, dtype=np.int64)
+
+def _score_hours(hours: np.ndarray) -> np.ndarray:
+    """Fairness scores for an array of local hours, in one table lookup"""
+    return _HOUR_SCORE_ARRAY[hours]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=pytz.UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+@lru_cache(maxsize=None)
+def _tz(name: str):
+    """pytz timezone by name, resolved once per name (tzinfo objects are shareable)"""
+    return pytz.timezone(name)
+
+@dataclass(frozen=True, slots=True)
+class _TimezoneImpact:
+    """How a meeting time lands in one participant timezone"""
+    local_time: str
+    hour: int
+    score: int
+    impact: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """API form of the impact"""
+        return {"local_time": self.local_time, "hour": self.hour, "score": self.score, "impact": self.impact}
+        
+@dataclass(frozen=True, slots=True)
+class _FairnessResult:
+    """Fairness of a meeting time; turned into the API's dict only at the boundary"""
+    avg_score: float
+    timezone_impacts: Dict[str, _TimezoneImpact]
+    meeting_time_utc: str
+    
+    @property
+    def fairness_score(self) -> float:
+        """Average score, rounded for display"""
+        return round(self.avg_score, 2)
+        
+    @property
+    def recommendation(self) -> str:
+        """Recommendation text for the average score"""
+        return (
+            "Excellent time for all participants" if self.avg_score >= 9 else
+            "Good time for most participants" if self.avg_score >= 7 else
+            "Fair time with some inconvenience" if self.avg_score >= 5 else
+            "Poor time - consider alternatives"
+        )
+        
+    def impacts_to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """API form of the per-timezone impacts"""
+        return {tz_name: impact.to_dict() for tz_name, impact in self.timezone_impacts.items()}
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """API form of the whole result"""
+        impacts = self.timezone_impacts.values()
+        return {
+            "fairness_score": self.fairness_score,
+            "timezone_impacts": self.impacts_to_dict(),
+            "meeting_time_utc": self.meeting_time_utc,
+            "analysis": {
+                "excellent_timezones": sum(impact.score >= 9 for impact in impacts),
+                "good_timezones": sum(impact.score >= 7 for impact in impacts),
+                "poor_timezones": sum(impact.score < 5 for impact in impacts)
+            },
+            "recommendation": self.recommendation
+        }
+        
 class TimeZoneService:
     """Service for time zone operations"""
     
@@ -30,11 +106,11 @@ class TimeZoneService:
             "Australia/Sydney": "AEST/AEDT"
         }
         
-    def get_timezone_info(self, timezone_name: str) -> Dict[str, Any]:
-        """Get information about a timezone"""
+    def get_timezone_info(self, timezone_name: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Get information about a timezone (at `now`, an aware datetime, if given)"""
         try:
-            tz = pytz.timezone(timezone_name)
-            now = datetime.now(tz)
+            tz = _tz(timezone_name)
+            now = now.astimezone(tz) if now else datetime.now(tz)
             
             return {
                 "timezone": timezone_name,
@@ -56,8 +132,8 @@ class TimeZoneService:
     ) -> datetime:
         """Convert datetime from one timezone to another"""
         try:
-            from_timezone = pytz.timezone(from_tz)
-            to_timezone = pytz.timezone(to_tz)
+            from_timezone = _tz(from_tz)
+            to_timezone = _tz(to_tz)
             
             # Localize the datetime if it's naive
             if dt.tzinfo is None:
@@ -74,57 +150,56 @@ class TimeZoneService:
         self,
         timezones: List[str],
         working_start: time = time(9, 0),
-        working_end: time = time(17, 0)
+        working_end: time = time(17, 0),
+        today: Optional[date] = None
     ) -> Dict[str, Any]:
         """Find overlapping working hours across multiple timezones"""
         try:
             # Use today as reference date
-            today = datetime.now().date()
-            
-            # Convert working hours to UTC for each timezone
-            utc_windows = []
-            
-            for tz_name in timezones:
-                tz = pytz.timezone(tz_name)
-                
-                # Create datetime objects for working hours
-                start_dt = tz.localize(datetime.combine(today, working_start))
-                end_dt = tz.localize(datetime.combine(today, working_end))
-                
-                # Convert to UTC
-                start_utc = start_dt.astimezone(pytz.UTC)
-                end_utc = end_dt.astimezone(pytz.UTC)
-                
-                utc_windows.append({
-                    "timezone": tz_name,
-                    "start_utc": start_utc,
-                    "end_utc": end_utc
-                })
+            today = today or datetime.now().date()
             
             # Find intersection of all windows
-            if not utc_windows:
+            if not timezones:
                 return {"overlap_found": False}
                 
-            # Start with first window
-            common_start = utc_windows[0]["start_utc"]
-            common_end = utc_windows[0]["end_utc"]
+            # Working hours as UTC microseconds: today's wall-clock time shifted by
+            # each timezone's offset at that time (start and end separately, in
+            # case a DST change falls inside the working day). The common window
+            # is the latest start and the earliest end; stop as soon as it is empty.
+            # The wall-clock times are built once; each distinct timezone is
+            # localized once.
+            unique_timezones = list(dict.fromkeys(timezones))
+            day_start = datetime.combine(today, working_start)
+            day_end = datetime.combine(today, working_end)
+            start_us = (day_start.replace(tzinfo=pytz.UTC) - _EPOCH) // _MICROSECOND
+            end_us = (day_end.replace(tzinfo=pytz.UTC) - _EPOCH) // _MICROSECOND
             
-            # Find intersection with all other windows
-            for window in utc_windows[1:]:
-                common_start = max(common_start, window["start_utc"])
-                common_end = min(common_end, window["end_utc"])
+            common_start_us = None
+            common_end_us = None
+            for tz_name in unique_timezones:
+                tz = _tz(tz_name)
+                tz_start_us = start_us - tz.localize(day_start).utcoffset() // _MICROSECOND
+                tz_end_us = end_us - tz.localize(day_end).utcoffset() // _MICROSECOND
                 
-            # Check if there's any overlap
-            if common_start >= common_end:
-                return {
-                    "overlap_found": False,
-                    "message": "No common working hours found across all timezones"
-                }
+                if common_start_us is None or tz_start_us > common_start_us:
+                    common_start_us = tz_start_us
+                if common_end_us is None or tz_end_us < common_end_us:
+                    common_end_us = tz_end_us
+                    
+                # Check if there's any overlap left
+                if common_start_us >= common_end_us:
+                    return {
+                        "overlap_found": False,
+                        "message": "No common working hours found across all timezones"
+                    }
+                    
+            common_start = _EPOCH + common_start_us * _MICROSECOND
+            common_end = _EPOCH + common_end_us * _MICROSECOND
             
             # Convert back to each timezone for display
             local_times = {}
-            for tz_name in timezones:
-                tz = pytz.timezone(tz_name)
+            for tz_name in unique_timezones:
+                tz = _tz(tz_name)
                 local_start = common_start.astimezone(tz)
                 local_end = common_end.astimezone(tz)
                 
@@ -156,63 +231,44 @@ class TimeZoneService:
     ) -> Dict[str, Any]:
         """Calculate fairness score for a meeting time across timezones"""
         try:
-            timezone_impacts = {}
-            total_score = 0
-            
-            for tz_name in participant_timezones:
-                tz = pytz.timezone(tz_name)
-                local_time = meeting_time.astimezone(tz)
-                hour = local_time.hour
-                
-                # Score based on local time (0-10 scale)
-                if 9 <= hour <= 17:
-                    score = 10  # Perfect business hours
-                elif 8 <= hour <= 18:
-                    score = 8   # Acceptable
-                elif 7 <= hour <= 19:
-                    score = 6   # Early/late but manageable
-                elif 6 <= hour <= 20:
-                    score = 4   # Very early/late
-                else:
-                    score = 1   # Unreasonable hours
-                
-                timezone_impacts[tz_name] = {
-                    "local_time": local_time.strftime("%H:%M %Z"),
-                    "hour": hour,
-                    "score": score,
-                    "impact": (
-                        "excellent" if score >= 9 else
-                        "good" if score >= 7 else
-                        "fair" if score >= 5 else
-                        "poor"
-                    )
-                }
-                
-                total_score += score
-            
-            avg_score = total_score / len(participant_timezones) if participant_timezones else 0
-            
-            return {
-                "fairness_score": round(avg_score, 2),
-                "timezone_impacts": timezone_impacts,
-                "meeting_time_utc": meeting_time.isoformat(),
-                "analysis": {
-                    "excellent_timezones": len([t for t in timezone_impacts.values() if t["score"] >= 9]),
-                    "good_timezones": len([t for t in timezone_impacts.values() if t["score"] >= 7]),
-                    "poor_timezones": len([t for t in timezone_impacts.values() if t["score"] < 5])
-                },
-                "recommendation": (
-                    "Excellent time for all participants" if avg_score >= 9 else
-                    "Good time for most participants" if avg_score >= 7 else
-                    "Fair time with some inconvenience" if avg_score >= 5 else
-                    "Poor time - consider alternatives"
-                )
-            }
+            return self._score_fairness(meeting_time, participant_timezones).to_dict()
             
         except Exception as e:
             logger.error(f"Error calculating timezone fairness: {e}")
             return {"fairness_score": 0, "error": str(e)}
             
+    def _score_fairness(
+        self,
+        meeting_time: datetime,
+        participant_timezones: List[str]
+    ) -> _FairnessResult:
+        """Fairness of a meeting time across timezones, as a record"""
+        # Participants sharing a timezone share a local time: convert once per
+        # timezone and count how many participants each one stands for
+        participants_per_tz = Counter(participant_timezones)
+        local_times = [meeting_time.astimezone(_tz(tz_name)) for tz_name in participants_per_tz]
+        
+        # Score based on local time (0-10 scale), for every timezone at once
+        hours = np.fromiter((local_time.hour for local_time in local_times), dtype=np.intp, count=len(local_times))
+        scores = _score_hours(hours)
+        total_score = int(scores @ np.fromiter(participants_per_tz.values(), dtype=np.int64, count=len(local_times)))
+        
+        timezone_impacts = {
+            tz_name: _TimezoneImpact(
+                local_time=local_time.strftime("%H:%M %Z"),
+                hour=local_time.hour,
+                score=score,
+                impact=_IMPACT_BY_SCORE[score]
+            )
+            for tz_name, local_time, score in zip(participants_per_tz, local_times, scores.tolist())
+        }
+        
+        return _FairnessResult(
+            avg_score=total_score / len(participant_timezones) if participant_timezones else 0,
+            timezone_impacts=timezone_impacts,
+            meeting_time_utc=meeting_time.isoformat()
+        )
+        
     def suggest_meeting_times(
         self,
         participant_timezones: List[str],
@@ -223,15 +279,26 @@ class TimeZoneService:
         try:
             suggestions = []
             
+            # One clock read for the whole request
+            base_date = datetime.now().date()
+            
             # Find common working hours
-            common_hours = self.find_common_working_hours(participant_timezones)
+            common_hours = self.find_common_working_hours(participant_timezones, today=base_date)
             
             if not common_hours.get("overlap_found"):
                 return []
             
-            # Generate suggestions for the next week
-            base_date = datetime.now().date()
+            # The common window start (on today's date) and its fairness. The local
+            # hours, and so the score, repeat every day unless a UTC offset changes
+            common_start_template = datetime.fromisoformat(common_hours["common_window_utc"]["start"])
+            fairness_template = self._score_fairness(common_start_template, participant_timezones)
+            template_impacts = fairness_template.impacts_to_dict()
+            template_offsets = [
+                common_start_template.astimezone(_tz(tz_name)).utcoffset()
+                for tz_name in participant_timezones
+            ]
             
+            # Generate suggestions for the next week
             for day_offset in range(1, days_ahead + 1):
                 # Skip weekends
                 target_date = base_date + timedelta(days=day_offset)
@@ -239,24 +306,27 @@ class TimeZoneService:
                     continue
                 
                 # Use the common window start time
-                common_start = datetime.fromisoformat(
-                    common_hours["common_window_utc"]["start"]
-                ).replace(
+                common_start = common_start_template.replace(
                     year=target_date.year,
                     month=target_date.month,
                     day=target_date.day
                 )
                 
-                # Calculate fairness score
-                fairness = self.get_timezone_fairness_score(common_start, participant_timezones)
+                # Reuse the template's fairness unless a DST change moves someone's local time
+                offsets = [common_start.astimezone(_tz(tz_name)).utcoffset() for tz_name in participant_timezones]
+                if offsets == template_offsets:
+                    fairness, impacts = fairness_template, template_impacts
+                else:
+                    fairness = self._score_fairness(common_start, participant_timezones)
+                    impacts = fairness.impacts_to_dict()
                 
                 suggestions.append({
                     "date": target_date.isoformat(),
                     "start_time_utc": common_start.isoformat(),
                     "end_time_utc": (common_start + timedelta(minutes=duration_minutes)).isoformat(),
-                    "fairness_score": fairness["fairness_score"],
-                    "timezone_impacts": fairness["timezone_impacts"],
-                    "recommendation": fairness["recommendation"]
+                    "fairness_score": fairness.fairness_score,
+                    "timezone_impacts": impacts,
+                    "recommendation": fairness.recommendation
                 })
             
             # Sort by fairness score (descending)
@@ -4,57 +4,111 @@ User Service
 Core service for managing user data and preferences.
 """
 
-import json
+import asyncio
 import os
+from collections import defaultdict
 from typing import List, Optional, Dict, Any
 import logging
 
+from pydantic import TypeAdapter
+
 from ...models.user import User, UserPreferences
 
 logger = logging.getLogger(__name__)
 
+# Built once; validates (and dumps) a whole file of users without per-item calls
+_USER_LIST_ADAPTER = TypeAdapter(List[User])
+_USER_ADAPTER = TypeAdapter(User)
+
+# Above this many users the file is written one user at a time, so the whole
+# encoded file never has to be held in memory at once
+_STREAMING_DUMP_USERS = 10_000
+
 class UserService:
     """Core user service for user management"""
     
     def __init__(self, data_file: str = "data/users.json"):
         self.data_file = data_file
         self._users_cache: Optional[List[User]] = None
+        # File mtime the cache was loaded at; a change on disk forces a re-read
+        self._users_mtime_ns: Optional[int] = None
+        
+        # Indexes over the cached users, rebuilt whenever the cache changes
+        self._by_id: Dict[str, User] = {}
+        self._by_manager: Dict[str, List[User]] = {}  # In cache order
+        self._by_department: Dict[str, List[User]] = {}  # Lower-cased keys, in cache order
+        # Highest N among "user_N" IDs; new users take the next number
+        self._max_user_num = 0
         
+        # Updates made with flush=False that are not yet written to the data file
+        self._dirty = False
+        
+    def _file_mtime_ns(self) -> Optional[int]:
+        """Modification time of the data file, or None if it is missing"""
+        try:
+            return os.stat(self.data_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+            
     async def load_users(self) -> List[User]:
         """Load users from JSON file"""
-        if self._users_cache is not None:
+        mtime_ns = self._file_mtime_ns()
+        if self._users_cache is not None and (self._dirty or mtime_ns == self._users_mtime_ns):
+            # Unflushed changes win over whatever is on disk
             return self._users_cache
             
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    users_data = json.load(f)
-                    
-                self._users_cache = [
-                    User(**user_data) for user_data in users_data
-                ]
+            if mtime_ns is not None:
+                # Read and validate off the event loop so concurrent loads can overlap
+                users = await asyncio.to_thread(self._read_data_file)
             else:
                 logger.warning(f"Users file {self.data_file} not found")
-                self._users_cache = []
+                users = []
                 
         except Exception as e:
             logger.error(f"Error loading users: {e}")
-            self._users_cache = []
+            users = []
             
+        self._set_cache(users, mtime_ns)
         return self._users_cache
         
+    def _set_cache(self, users: List[User], mtime_ns: Optional[int]):
+        """Remember users as the cached copy and rebuild the lookup indexes"""
+        self._users_cache = users
+        self._users_mtime_ns = mtime_ns
+        
+        by_id: Dict[str, User] = {}
+        by_manager: Dict[str, List[User]] = defaultdict(list)
+        by_department: Dict[str, List[User]] = defaultdict(list)
+        max_user_num = 0
+        for user in users:
+            by_id.setdefault(user.user_id, user)  # First match wins, as in a scan
+            prefix, _, number = user.user_id.partition("_")
+            if prefix == "user" and number.isdigit():
+                max_user_num = max(max_user_num, int(number))
+            if user.manager_id:
+                by_manager[user.manager_id].append(user)
+            by_department[user.department_lower].append(user)
+            
+        self._by_id = by_id
+        self._by_manager = dict(by_manager)
+        self._by_department = dict(by_department)
+        self._max_user_num = max_user_num
+        
+    def _read_data_file(self) -> List[User]:
+        """Parse and validate the users JSON file in one pydantic-core pass"""
+        with open(self.data_file, 'rb') as f:
+            return _USER_LIST_ADAPTER.validate_json(f.read())
+            
     async def save_users(self, users: List[User]) -> bool:
         """Save users to JSON file"""
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+            # Create the directory, serialize and write off the event loop; users
+            # are frozen, so a shallow copy of the list is a stable snapshot
+            await asyncio.to_thread(self._write_data_file, list(users))
             
-            users_data = [user.model_dump() for user in users]
-            
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(users_data, f, indent=2, default=str)
-                
-            self._users_cache = users
+            self._dirty = False
+            self._set_cache(users, self._file_mtime_ns())
             logger.info(f"Saved {len(users)} users to {self.data_file}")
             return True
             
@@ -62,48 +116,54 @@ class UserService:
             logger.error(f"Error saving users: {e}")
             return False
             
-    async def get_user(self, user_id: str) -> Optional[User]:
-        """Get a specific user by ID"""
-        users = await self.load_users()
+    async def flush(self) -> bool:
+        """Write updates made with flush=False to the data file"""
+        if not self._dirty:
+            return True
+        return await self.save_users(self._users_cache)
+            
+    def _write_data_file(self, users: List[User]):
+        """Serialize users and write them to the JSON file"""
+        # Ensure directory exists
+        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
         
-        for user in users:
-            if user.user_id == user_id:
-                return user
+        # One pydantic-core pass straight to JSON bytes, no intermediate dicts
+        with open(self.data_file, 'wb') as f:
+            if len(users) <= _STREAMING_DUMP_USERS:
+                f.write(_USER_LIST_ADAPTER.dump_json(users, indent=2))
+                return
                 
-        return None
+            # Same bytes as the one-shot dump: each user indented one level
+            # inside the array (encoded strings never contain raw newlines)
+            f.write(b"[\n")
+            for i, user in enumerate(users):
+                if i:
+                    f.write(b",\n")
+                f.write(b"  " + _USER_ADAPTER.dump_json(user, indent=2).replace(b"\n", b"\n  "))
+            f.write(b"\n]")
+            
+    async def get_user(self, user_id: str) -> Optional[User]:
+        """Get a specific user by ID"""
+        await self.load_users()
+        return self._by_id.get(user_id)
         
     async def get_users_by_ids(self, user_ids: List[str]) -> List[User]:
-        """Get multiple users by their IDs"""
-        users = await self.load_users()
-        result = []
-        
-        for user in users:
-            if user.user_id in user_ids:
-                result.append(user)
-                
-        return result
+        """Get multiple users by their IDs (in the order given, unknown IDs skipped)"""
+        await self.load_users()
+        return [
+            self._by_id[user_id] for user_id in dict.fromkeys(user_ids)
+            if user_id in self._by_id
+        ]
         
     async def get_team_members(self, manager_id: str) -> List[User]:
         """Get all team members for a manager"""
-        users = await self.load_users()
-        team_members = []
-        
-        for user in users:
-            if user.manager_id == manager_id:
-                team_members.append(user)
-                
-        return team_members
+        await self.load_users()
+        return list(self._by_manager.get(manager_id, ()))
         
     async def get_users_by_department(self, department: str) -> List[User]:
         """Get all users in a department"""
-        users = await self.load_users()
-        dept_users = []
-        
-        for user in users:
-            if user.department.lower() == department.lower():
-                dept_users.append(user)
-                
-        return dept_users
+        await self.load_users()
+        return list(self._by_department.get(department.lower(), ()))
         
     async def create_user(self, user_data: Dict[str, Any]) -> User:
         """Create a new user"""
@@ -111,11 +171,8 @@ class UserService:
         
         # Generate new user ID if not provided
         if "user_id" not in user_data:
-            existing_ids = {u.user_id for u in users}
-            counter = 1
-            while f"user_{counter:03d}" in existing_ids:
-                counter += 1
-            user_data["user_id"] = f"user_{counter:03d}"
+            self._max_user_num += 1
+            user_data["user_id"] = f"user_{self._max_user_num:03d}"
             
         user = User(**user_data)
         users.append(user)
@@ -124,31 +181,49 @@ class UserService:
         logger.info(f"Created user {user.user_id}: {user.name}")
         return user
         
-    async def update_user(self, user_id: str, updates: Dict[str, Any]) -> Optional[User]:
-        """Update an existing user"""
+    async def update_user(
+        self,
+        user_id: str,
+        updates: Dict[str, Any],
+        flush: bool = True
+    ) -> Optional[User]:
+        """Update an existing user
+        
+        With flush=False the change is kept in memory only; batch callers
+        make their updates and then write them all with one flush().
+        """
         users = await self.load_users()
         
-        for i, user in enumerate(users):
-            if user.user_id == user_id:
-                # Apply updates
-                for field, value in updates.items():
-                    if hasattr(user, field):
-                        setattr(user, field, value)
-                        
-                await self.save_users(users)
-                logger.info(f"Updated user {user_id}")
-                return user
-                
-        logger.warning(f"User {user_id} not found for update")
-        return None
+        user = self._by_id.get(user_id)
+        if user is None:
+            logger.warning(f"User {user_id} not found for update")
+            return None
+            
+        # Apply updates (users are frozen, so swap in an updated copy)
+        i = users.index(user)
+        # Re-validated rather than model_copy'd so the updated fields are validated
+        user = User(**{
+            field: updates[field] if field in updates else getattr(user, field)
+            for field in User.model_fields
+        })
+        users[i] = user
+        
+        if flush:
+            await self.save_users(users)
+        else:
+            self._set_cache(users, self._users_mtime_ns)
+            self._dirty = True
+        logger.info(f"Updated user {user_id}")
+        return user
         
     async def update_user_preferences(
         self,
         user_id: str,
-        preferences: UserPreferences
+        preferences: UserPreferences,
+        flush: bool = True
     ) -> Optional[User]:
         """Update user preferences"""
-        return await self.update_user(user_id, {"preferences": preferences})
+        return await self.update_user(user_id, {"preferences": preferences}, flush=flush)
         
     async def get_user_availability_summary(self, user_id: str) -> Dict[str, Any]:
         """Get a summary of user's availability preferences"""
@@ -184,30 +259,22 @@ class UserService:
     async def find_users_by_criteria(self, criteria: Dict[str, Any]) -> List[User]:
         """Find users matching specific criteria"""
         users = await self.load_users()
-        results = []
         
-        for user in users:
-            match = True
-            
-            # Check each criteria
-            for field, value in criteria.items():
-                if field == "department" and user.department.lower() != value.lower():
-                    match = False
-                    break
-                elif field == "role" and user.role.lower() != value.lower():
-                    match = False
-                    break
-                elif field == "time_zone" and user.preferences.time_zone != value:
-                    match = False
-                    break
-                elif field == "is_active" and user.is_active != value:
-                    match = False
-                    break
-                    
-            if match:
-                results.append(user)
-                
-        return results
+        # A department criterion narrows the scan to that department's users
+        if "department" in criteria:
+            users = self._by_department.get(criteria["department"].lower(), [])
+            
+        # Turn the remaining criteria into predicates once, cheapest first,
+        # with the lower-cased targets computed up front
+        predicates = []
+        if "is_active" in criteria:
+            predicates.append(lambda user, value=criteria["is_active"]: user.is_active == value)
+        if "time_zone" in criteria:
+            predicates.append(lambda user, value=criteria["time_zone"]: user.preferences.time_zone == value)
+        if "role" in criteria:
+            predicates.append(lambda user, value=criteria["role"].lower(): user.role_lower == value)
+            
+        return [user for user in users if all(predicate(user) for predicate in predicates)]
         
     async def get_organization_structure(self) -> Dict[str, Any]:
         """Get the organization structure"""
@@ -241,5 +308,16 @@ class UserService:
         }
         
     def clear_cache(self):
-        """Clear the users cache"""
+        """Clear the users cache (unflushed updates are discarded)"""
+        self._dirty = False
+        self._set_cache([], None)
         self._users_cache = None
+
+_instance = None
+
+def get_user_service() -> UserService:
+    """Return the shared UserService, creating it on first call"""
+    global _instance
+    if _instance is None:
+        _instance = UserService()
+    return _instance
@@ -0,0 +1,16 @@
+"""Single access point for the shared service instances
+
+Each getter builds its service on first call and returns the same instance
+afterwards, so the server and every tool share one meetings cache and one
+users cache per process.
+"""
+
+from .ai.optimal_time_service import get_optimal_time_service
+from .core.calendar_service import get_calendar_service
+from .core.user_service import get_user_service
+
+__all__ = [
+    "get_calendar_service",
+    "get_optimal_time_service",
+    "get_user_service",
+]
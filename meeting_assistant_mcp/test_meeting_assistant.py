@@ -7,6 +7,7 @@ This script tests all the core functionality of the meeting assistant.
 
 import asyncio
 import json
+from collections import Counter
 from datetime import datetime, timedelta
 import logging
 
@@ -19,13 +20,10 @@ from services.core.calendar_service import CalendarService
 from services.core.user_service import UserService
 from services.ai.optimal_time_service import OptimalTimeService
 
-async def test_data_loading():
+async def test_data_loading(calendar_service: CalendarService, user_service: UserService):
     """Test loading of users and meetings data"""
     logger.info("Testing data loading...")
     
-    calendar_service = CalendarService("data/meetings.json")
-    user_service = UserService("data/users.json")
-    
     # Load data
     users = await user_service.load_users()
     meetings = await calendar_service.load_meetings()
@@ -49,12 +47,10 @@ async def test_data_loading():
     
     return users, meetings
 
-async def test_optimal_time_service():
+async def test_optimal_time_service(calendar_service: CalendarService, user_service: UserService):
     """Test the optimal time slot recommendation service"""
     logger.info("Testing optimal time slot service...")
     
-    calendar_service = CalendarService("data/meetings.json")
-    user_service = UserService("data/users.json")
     optimal_service = OptimalTimeService(calendar_service, user_service)
     
     # Test parameters
@@ -84,12 +80,10 @@ async def test_optimal_time_service():
         logger.error(f"Error testing optimal time service: {e}")
         return []
 
-async def test_calendar_operations():
+async def test_calendar_operations(calendar_service: CalendarService, user_service: UserService):
     """Test calendar CRUD operations"""
     logger.info("Testing calendar operations...")
     
-    calendar_service = CalendarService("data/meetings.json")
-    
     # Test getting meetings for a user
     user_meetings = await calendar_service.get_user_meetings("user_001")
     logger.info(f"User_001 has {len(user_meetings)} meetings")
@@ -104,12 +98,10 @@ async def test_calendar_operations():
     
     return user_meetings, search_results, stats
 
-async def test_user_operations():
+async def test_user_operations(calendar_service: CalendarService, user_service: UserService):
     """Test user service operations"""
     logger.info("Testing user operations...")
     
-    user_service = UserService("data/users.json")
-    
     # Test getting user
     user = await user_service.get_user("user_001")
     if user:
@@ -129,12 +121,10 @@ async def test_user_operations():
     
     return user, availability, eng_users
 
-async def test_conflict_detection():
+async def test_conflict_detection(calendar_service: CalendarService, user_service: UserService):
     """Test conflict detection functionality"""
     logger.info("Testing conflict detection...")
     
-    calendar_service = CalendarService("data/meetings.json")
-    
     # Test with a known busy time
     test_start = datetime(2024, 12, 16, 14, 0)  # 2 PM
     test_end = datetime(2024, 12, 16, 15, 0)    # 3 PM
@@ -152,12 +142,10 @@ async def test_conflict_detection():
     
     return conflicts
 
-async def test_meeting_patterns():
+async def test_meeting_patterns(calendar_service: CalendarService, user_service: UserService):
     """Test meeting pattern analysis"""
     logger.info("Testing meeting pattern analysis...")
     
-    calendar_service = CalendarService("data/meetings.json")
-    
     # Get meetings for analysis
     end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=30)
@@ -165,26 +153,14 @@ async def test_meeting_patterns():
     user_meetings = await calendar_service.get_user_meetings("user_001", start_date, end_date)
     
     if user_meetings:
-        # Analyze patterns
-        meeting_types = {}
-        daily_counts = {}
-        hourly_counts = {}
+        # Analyze patterns: meeting type, daily and hourly distributions
+        meeting_types = Counter(meeting.meeting_type for meeting in user_meetings)
+        daily_counts = Counter(meeting.start_time.strftime('%A') for meeting in user_meetings)
+        hourly_counts = Counter(meeting.start_time.hour for meeting in user_meetings)
         
-        for meeting in user_meetings:
-            # Meeting type distribution
-            meeting_types[meeting.meeting_type] = meeting_types.get(meeting.meeting_type, 0) + 1
-            
-            # Daily distribution
-            day = meeting.start_time.strftime('%A')
-            daily_counts[day] = daily_counts.get(day, 0) + 1
-            
-            # Hourly distribution
-            hour = meeting.start_time.hour
-            hourly_counts[hour] = hourly_counts.get(hour, 0) + 1
-        
-        logger.info(f"Meeting type distribution: {meeting_types}")
-        logger.info(f"Daily distribution: {daily_counts}")
-        logger.info(f"Peak hours: {sorted(hourly_counts.items(), key=lambda x: x[1], reverse=True)[:3]}")
+        logger.info(f"Meeting type distribution: {dict(meeting_types)}")
+        logger.info(f"Daily distribution: {dict(daily_counts)}")
+        logger.info(f"Peak hours: {hourly_counts.most_common(3)}")
     
     return user_meetings
 
@@ -192,24 +168,28 @@ async def run_comprehensive_test():
     """Run comprehensive test of all functionality"""
     logger.info("Starting comprehensive test of Smart Meeting Assistant...")
     
+    # One pair of services for every test, so the data files are read once
+    calendar_service = CalendarService("data/meetings.json")
+    user_service = UserService("data/users.json")
+    
     try:
         # Test 1: Data Loading
-        users, meetings = await test_data_loading()
+        users, meetings = await test_data_loading(calendar_service, user_service)
         
         # Test 2: Calendar Operations
-        user_meetings, search_results, stats = await test_calendar_operations()
+        user_meetings, search_results, stats = await test_calendar_operations(calendar_service, user_service)
         
         # Test 3: User Operations
-        user, availability, eng_users = await test_user_operations()
+        user, availability, eng_users = await test_user_operations(calendar_service, user_service)
         
         # Test 4: Optimal Time Service
-        optimal_slots = await test_optimal_time_service()
+        optimal_slots = await test_optimal_time_service(calendar_service, user_service)
         
         # Test 5: Conflict Detection
-        conflicts = await test_conflict_detection()
+        conflicts = await test_conflict_detection(calendar_service, user_service)
         
         # Test 6: Meeting Patterns
-        pattern_meetings = await test_meeting_patterns()
+        pattern_meetings = await test_meeting_patterns(calendar_service, user_service)
         
         # Summary
         logger.info("\n" + "="*50)
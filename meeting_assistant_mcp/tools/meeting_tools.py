@@ -4,31 +4,78 @@ Meeting Assistant MCP Tools
 Implementation of all 8 MCP tools for the Smart Meeting Assistant.
 """
 
-from typing import List, Dict, Any, Optional
+import time
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
 import logging
+import orjson
 from fastmcp import FastMCP
 
-from ..services.ai.optimal_time_service import OptimalTimeService
-from ..services.core.calendar_service import CalendarService
-from ..services.core.user_service import UserService
+from ..services.registry import get_calendar_service, get_optimal_time_service
 from ..models.meeting import MeetingCreate
-from ..models.scheduling import OptimalSlot
+from ..models.scheduling import DateRange, OptimalSlot
 
 logger = logging.getLogger(__name__)
 
-# Initialize services (will be properly injected in main.py)
-calendar_service = CalendarService()
-user_service = UserService()
-optimal_time_service = OptimalTimeService(calendar_service, user_service)
-
 mcp = FastMCP("Smart Meeting Assistant")
 
+# Passed on for calls without preferences instead of a fresh {} each time;
+# read-only, so nothing downstream can modify the shared instance
+_EMPTY_PREFERENCES = MappingProxyType({})
+
+def _tool_guard(log_message: str, failure_message: str):
+    """Turn any exception a tool raises into its logged failure response"""
+    def decorator(tool):
+        @wraps(tool)
+        async def guarded(*args, **kwargs) -> Dict[str, Any]:
+            try:
+                return await tool(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s: %s", log_message, e)
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "message": failure_message
+                }
+        return guarded
+    return decorator
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp (trailing Z allowed); repeated strings hit the cache"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def _iso_z(value: datetime) -> str:
+    """Format a UTC datetime as ISO with the trailing Z the tools return
+    
+    datetime.isoformat is implemented in C, so this is one C call and one
+    string concatenation per timestamp.
+    """
+    return f"{value.isoformat()}Z"
+
+# Repeated find_optimal_slots queries (reloads, retries, polling) are answered
+# from here for a short while; the calendar version in the key drops every
+# entry once a meeting is created through create_meeting
+_SLOT_CACHE_TTL_SECONDS = 60.0
+_slot_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+_calendar_version = 0
+
+def _json_copy(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Independent copy of a JSON-shaped response via one orjson round trip
+    
+    Much cheaper than copy.deepcopy on the nested dicts/lists/floats the
+    tools return, and the copy holds exactly what would go over the wire.
+    """
+    return orjson.loads(orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY))
+
 @mcp.tool()
+@_tool_guard("Error finding optimal slots", "Failed to find optimal time slots")
 async def find_optimal_slots(
     participants: List[str],
     duration: int,
-    date_range: List[str],
+    date_range: DateRange,
     preferences: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
@@ -40,85 +87,125 @@ async def find_optimal_slots(
     Args:
         participants: List of participant user IDs
         duration: Meeting duration in minutes
-        date_range: List with [start_date, end_date] in ISO format
+        date_range: [start_date, end_date] in ISO format (parsed and validated on input)
         preferences: Optional meeting preferences and constraints
 
     Returns:
         Dictionary containing ranked optimal time slots with detailed scoring
     """
-    try:
-        logger.info(f"Finding optimal slots for {len(participants)} participants")
-
-        # Parse date range
-        start_date = datetime.fromisoformat(date_range[0].replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(date_range[1].replace('Z', '+00:00'))
-
-        # Find optimal slots using AI service
-        optimal_slots = await optimal_time_service.find_optimal_slots(
-            participants=participants,
-            duration=duration,
-            date_range=(start_date, end_date),
-            preferences=preferences or {}
-        )
-
-        if not optimal_slots:
-            return {
-                "success": False,
-                "message": "No suitable time slots found for all participants",
-                "optimal_slots": [],
-                "suggestions": [
-                    "Try extending the date range",
-                    "Consider reducing meeting duration",
-                    "Check if all participants are available during the specified period"
-                ]
-            }
-
-        # Format response
-        formatted_slots = []
-        for slot in optimal_slots:
-            formatted_slots.append({
-                "rank": slot.rank,
-                "start_time": slot.time_slot.start_time.isoformat() + "Z",
-                "end_time": slot.time_slot.end_time.isoformat() + "Z",
-                "duration_minutes": slot.time_slot.duration_minutes,
-                "overall_score": round(slot.overall_score, 2),
-                "score_breakdown": {
-                    "productivity": round(slot.productivity_score, 2),
-                    "convenience": round(slot.convenience_score, 2),
-                    "conflict_risk": round(slot.conflict_risk_score, 2),
-                    "preferences": round(slot.preference_score, 2)
-                },
-                "explanation": slot.explanation,
-                "participant_impact": slot.participant_impact,
-                "reasoning": slot.reasoning
-            })
-
-        return {
-            "success": True,
-            "optimal_slots": formatted_slots,
-            "analysis_summary": {
-                "participants_analyzed": len(participants),
-                "duration_requested": duration,
-                "date_range": date_range,
-                "slots_found": len(optimal_slots),
-                "best_score": round(optimal_slots[0].overall_score, 2) if optimal_slots else 0
-            },
-            "recommendations": [
-                f"Best option: {optimal_slots[0].explanation}" if optimal_slots else "No recommendations available",
-                "Consider the participant impact when making final decision",
-                "Higher scores indicate better overall fit for all participants"
-            ]
-        }
+    logger.info("Finding optimal slots for %d participants", len(participants))
 
-    except Exception as e:
-        logger.error(f"Error finding optimal slots: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Failed to find optimal time slots"
-        }
+    cache_key = (
+        _calendar_version,
+        tuple(participants),
+        duration,
+        date_range.start,
+        date_range.end,
+        orjson.dumps(preferences, option=orjson.OPT_SORT_KEYS) if preferences else b"{}"
+    )
+    cached = _slot_cache.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        # A copy, so callers can't change what later hits return
+        return _json_copy(cached[1])
+
+    response = await _find_optimal_slots_uncached(participants, duration, date_range, preferences)
+
+    # Drop expired entries (and those from older calendar versions) as new ones go in
+    now = time.monotonic()
+    stale = [
+        key for key, (expires_at, _) in _slot_cache.items()
+        if expires_at <= now or key[0] != _calendar_version
+    ]
+    for key in stale:
+        del _slot_cache[key]
+    _slot_cache[cache_key] = (now + _SLOT_CACHE_TTL_SECONDS, _json_copy(response))
+    return response
+
+def _build_slot_dict(slot: OptimalSlot, _round=round, _iso=_iso_z) -> Dict[str, Any]:
+    """Response entry for one ranked slot (builtins bound as locals for the loop)"""
+    time_slot = slot.time_slot
+    return {
+        "rank": slot.rank,
+        "start_time": _iso(time_slot.start_time),
+        "end_time": _iso(time_slot.end_time),
+        "duration_minutes": time_slot.duration_minutes,
+        "overall_score": _round(slot.overall_score, 2),
+        "score_breakdown": {
+            "productivity": _round(slot.productivity_score, 2),
+            "convenience": _round(slot.convenience_score, 2),
+            "conflict_risk": _round(slot.conflict_risk_score, 2),
+            "preferences": _round(slot.preference_score, 2)
+        },
+        "explanation": slot.explanation,
+        "participant_impact": slot.participant_impact,
+        "reasoning": slot.reasoning
+    }
+
+def _no_slots_response(message: str) -> Dict[str, Any]:
+    """Unsuccessful find_optimal_slots response with the usual suggestions"""
+    return {
+        "success": False,
+        "message": message,
+        "optimal_slots": [],
+        "suggestions": [
+            "Try extending the date range",
+            "Consider reducing meeting duration",
+            "Check if all participants are available during the specified period"
+        ]
+    }
+
+async def _find_optimal_slots_uncached(
+    participants: List[str],
+    duration: int,
+    date_range: DateRange,
+    preferences: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Run the scheduling pipeline and format its response (errors propagate)"""
+    start_date = date_range.start
+    end_date = date_range.end
+
+    # Requests no search could satisfy skip the service (and its calendar reads);
+    # the range covers whole days, first to last inclusive
+    if not participants:
+        return _no_slots_response("No participants given")
+    if duration <= 0 or duration > 24 * 60:
+        return _no_slots_response("Meeting duration must be between 1 and 1440 minutes")
+    if end_date.date() < start_date.date():
+        return _no_slots_response("Date range ends before it starts")
+
+    # Find optimal slots using AI service
+    optimal_slots = await get_optimal_time_service().find_optimal_slots(
+        participants=participants,
+        duration=duration,
+        date_range=(start_date, end_date),
+        preferences=preferences or _EMPTY_PREFERENCES
+    )
+
+    if not optimal_slots:
+        return _no_slots_response("No suitable time slots found for all participants")
+
+    # Format response
+    formatted_slots = [_build_slot_dict(slot) for slot in optimal_slots]
+
+    return {
+        "success": True,
+        "optimal_slots": formatted_slots,
+        "analysis_summary": {
+            "participants_analyzed": len(participants),
+            "duration_requested": duration,
+            "date_range": [start_date.isoformat(), end_date.isoformat()],
+            "slots_found": len(optimal_slots),
+            "best_score": round(optimal_slots[0].overall_score, 2) if optimal_slots else 0
+        },
+        "recommendations": [
+            f"Best option: {optimal_slots[0].explanation}" if optimal_slots else "No recommendations available",
+            "Consider the participant impact when making final decision",
+            "Higher scores indicate better overall fit for all participants"
+        ]
+    }
 
 @mcp.tool()
+@_tool_guard("Error creating meeting", "Failed to create meeting")
 async def create_meeting(
     title: str,
     participants: List[str],
@@ -139,42 +226,38 @@ async def create_meeting(
     Returns:
         Dictionary containing created meeting details
     """
-    try:
-        # Create meeting data
-        meeting_data = MeetingCreate(
-            title=title,
-            participants=participants,
-            duration=duration,
-            preferences=preferences or {}
-        )
-
-        # Create the meeting
-        meeting = await calendar_service.create_meeting(meeting_data, organizer)
-
-        return {
-            "success": True,
-            "meeting": {
-                "meeting_id": meeting.meeting_id,
-                "title": meeting.title,
-                "participants": meeting.participants,
-                "organizer": meeting.organizer,
-                "start_time": meeting.start_time.isoformat() + "Z",
-                "end_time": meeting.end_time.isoformat() + "Z",
-                "status": meeting.status,
-                "location": meeting.location
-            },
-            "message": f"Meeting '{title}' created successfully"
-        }
+    global _calendar_version
+    # Create meeting data
+    meeting_data = MeetingCreate(
+        title=title,
+        participants=participants,
+        duration=duration,
+        preferences=preferences or _EMPTY_PREFERENCES
+    )
 
-    except Exception as e:
-        logger.error(f"Error creating meeting: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Failed to create meeting"
-        }
+    # Create the meeting
+    meeting = await get_calendar_service().create_meeting(meeting_data, organizer)
+    
+    # Cached slot recommendations no longer reflect the calendar
+    _calendar_version += 1
+
+    return {
+        "success": True,
+        "meeting": {
+            "meeting_id": meeting.meeting_id,
+            "title": meeting.title,
+            "participants": meeting.participants,
+            "organizer": meeting.organizer,
+            "start_time": _iso_z(meeting.start_time),
+            "end_time": _iso_z(meeting.end_time),
+            "status": meeting.status,
+            "location": meeting.location
+        },
+        "message": f"Meeting '{title}' created successfully"
+    }
 
 @mcp.tool()
+@_tool_guard("Error detecting conflicts", "Failed to detect scheduling conflicts")
 async def detect_scheduling_conflicts(
     user_id: str,
     start_time: str,
@@ -191,46 +274,38 @@ async def detect_scheduling_conflicts(
     Returns:
         Dictionary containing conflict analysis
     """
-    try:
-        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-
-        # Get user meetings in the time range
-        user_meetings = await calendar_service.get_user_meetings(user_id, start_dt, end_dt)
-
-        conflicts = []
-        for meeting in user_meetings:
-            # Check for overlap
-            if (meeting.start_time < end_dt and meeting.end_time > start_dt):
-                conflicts.append({
-                    "meeting_id": meeting.meeting_id,
-                    "title": meeting.title,
-                    "start_time": meeting.start_time.isoformat() + "Z",
-                    "end_time": meeting.end_time.isoformat() + "Z",
-                    "conflict_type": "overlap",
-                    "severity": "high"
-                })
-
-        return {
-            "success": True,
-            "user_id": user_id,
-            "time_range": {
-                "start": start_time,
-                "end": end_time
-            },
-            "conflicts_found": len(conflicts),
-            "conflicts": conflicts,
-            "is_available": len(conflicts) == 0,
-            "recommendations": [
-                "No conflicts found - time slot is available" if len(conflicts) == 0
-                else f"Found {len(conflicts)} conflicts - consider alternative times"
-            ]
+    start_dt = _parse_iso(start_time)
+    end_dt = _parse_iso(end_time)
+
+    # Only meetings overlapping the range come back, so each one is a conflict
+    overlapping = await get_calendar_service().get_overlapping_meetings(user_id, start_dt, end_dt)
+    iso = _iso_z
+
+    conflicts = [
+        {
+            "meeting_id": meeting.meeting_id,
+            "title": meeting.title,
+            "start_time": iso(meeting.start_time),
+            "end_time": iso(meeting.end_time),
+            "conflict_type": "overlap",
+            "severity": "high"
         }
+        for meeting in overlapping
+    ]
+    conflicts_found = len(conflicts)
 
-    except Exception as e:
-        logger.error(f"Error detecting conflicts: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Failed to detect scheduling conflicts"
-        }
\ No newline at end of file
+    return {
+        "success": True,
+        "user_id": user_id,
+        "time_range": {
+            "start": start_time,
+            "end": end_time
+        },
+        "conflicts_found": conflicts_found,
+        "conflicts": conflicts,
+        "is_available": conflicts_found == 0,
+        "recommendations": [
+            "No conflicts found - time slot is available" if conflicts_found == 0
+            else f"Found {conflicts_found} conflicts - consider alternative times"
+        ]
+    }
\ No newline at end of file